@@ -1,31 +1,55 @@
 """
 Project Briareus — Agents Package
 Registry of all specialist agents for easy lookup by the supervisor.
+Agent modules are imported on first use, so a run only pays the import cost
+of the tool stacks (Tavily, LangChain community, ...) it actually needs.
 """
 
-from agents.base import BaseAgent
-from agents.researcher import ResearcherAgent
-from agents.coder import CoderAgent
-from agents.writer import WriterAgent
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agents.base import BaseAgent
 
 
 # ── Agent Registry ────────────────────────────
-# The supervisor uses this to instantiate agents by name.
+# The supervisor uses this to instantiate agents by name ("module:Class").
+
+AGENT_REGISTRY: dict[str, str] = {
+    "researcher": "agents.researcher:ResearcherAgent",
+    "coder": "agents.coder:CoderAgent",
+    "writer": "agents.writer:WriterAgent",
+}
 
-AGENT_REGISTRY: dict[str, type[BaseAgent]] = {
-    "researcher": ResearcherAgent,
-    "coder": CoderAgent,
-    "writer": WriterAgent,
+_LAZY_EXPORTS: dict[str, str] = {
+    "BaseAgent": "agents.base:BaseAgent",
+    **{path.split(":")[1]: path for path in AGENT_REGISTRY.values()},
 }
 
 
+def _load(path: str) -> Any:
+    module_name, attr = path.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
 def get_agent(name: str, **kwargs) -> BaseAgent:
     """Instantiate an agent by name from the registry."""
     if name not in AGENT_REGISTRY:
         raise ValueError(
             f"Unknown agent '{name}'. Available: {list(AGENT_REGISTRY.keys())}"
         )
-    return AGENT_REGISTRY[name](**kwargs)
+    return _load(AGENT_REGISTRY[name])(**kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook: import agent classes on first attribute access."""
+    if name in _LAZY_EXPORTS:
+        value = _load(_LAZY_EXPORTS[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -35,4 +59,4 @@ __all__ = [
     "WriterAgent",
     "AGENT_REGISTRY",
     "get_agent",
-]
\ No newline at end of file
+]
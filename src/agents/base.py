@@ -1,21 +1,29 @@
 """
 Project Briareus — Base Agent
 Abstract base class defining the shared interface for all specialist agents.
-Every sub-agent inherits from this and implements `_execute`.
+Every sub-agent inherits from this and implements `_aexecute`.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from pydantic import BaseModel
+from langchain_core.messages import HumanMessage
+from pydantic import BaseModel, ValidationError
 
+from cache import agent_cache
 from config.prompts import build_agent_prompt
 from config.settings import AGENT_MODEL, AGENT_TEMPERATURE
+from llm.factory import get_chat_model
+from llm.prompt_cache import cached_prompt_tokens, system_message
+from llm.tokens import CHARS_PER_TOKEN, estimate_tokens
+from observability.log import log
+from state.schemas import ToolPlan
 
 
 class BaseAgent(ABC):
@@ -26,7 +34,7 @@ class BaseAgent(ABC):
         1. Set `name` and `system_prompt` class attributes.
         2. Define `output_schema` (a Pydantic model class).
         3. Optionally override `_get_tools()` to bind tools to the LLM.
-        4. Optionally override `_execute()` for custom logic.
+        4. Optionally override `_aexecute()` for custom logic.
     """
 
     name: str = "base"
@@ -34,24 +42,43 @@ class BaseAgent(ABC):
     output_schema: type[BaseModel] = BaseModel
 
     def __init__(self, model: str | None = None, temperature: float | None = None):
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash", # Very cheap, INPUT: $0.10 / 1M tokens, OUTPUT: $0.40 / 1M tokens
+        self.llm = get_chat_model(
+            model or AGENT_MODEL,
+            temperature if temperature is not None else AGENT_TEMPERATURE,
         )
+        # Stable per-agent prefix for response-cache keys
+        self._cache_sig = hashlib.blake2b(
+            (self.system_prompt + self.llm.model + self.output_schema.__name__).encode()
+        ).hexdigest()[:16]
+        # Built once so every call shares a byte-identical, cacheable prefix
+        self._system_message = system_message(self.system_prompt)
+        # Structured calls currently in flight, by cache key (see `_singleflight_invoke`)
+        self._inflight: dict[str, asyncio.Future] = {}
         self._bind_tools()
 
     # ── Tool Binding ──────────────────────────
 
     def _get_tools(self) -> list:
-        """Override to return LangChain-compatible tools for this agent."""
+        """
+        Override to return LangChain-compatible tools for this agent.
+        Called once, from `_bind_tools`; use `self._tools` afterwards.
+        """
         return []
 
     def _bind_tools(self) -> None:
         """Bind tools and structured output to the LLM."""
-        tools = self._get_tools()
-        if tools:
-            self.llm_with_tools = self.llm.bind_tools(tools)
+        self._tools = self._get_tools()
+        self._tools_by_name = {t.name: t for t in self._tools}
+
+        if self._tools:
+            # The output schema rides along as one more "tool" — calling it
+            # is how the model hands back its final, schema-valid answer.
+            self.llm_with_tools = self.llm.bind_tools(self._tools + [self.output_schema])
+            # For programmatic tool calling: plan every call up front
+            self.llm_tool_plan = self.llm.with_structured_output(ToolPlan)
         else:
             self.llm_with_tools = None
+            self.llm_tool_plan = None
 
         # Separate LLM instance for final structured output (no tools)
         self.llm_structured = self.llm.with_structured_output(self.output_schema)
@@ -59,6 +86,10 @@ class BaseAgent(ABC):
     # ── Execution ─────────────────────────────
 
     def run(self, task_brief: str, context: str | None = None) -> dict[str, Any]:
+        """Synchronous wrapper around `arun` for callers outside an event loop."""
+        return asyncio.run(self.arun(task_brief, context))
+
+    async def arun(self, task_brief: str, context: str | None = None) -> dict[str, Any]:
         """
         Public entry point. Runs the agent and returns a dict of its structured output.
 
@@ -69,12 +100,41 @@ class BaseAgent(ABC):
         Returns:
             Dict representation of the agent's Pydantic output model.
         """
-        print(f"\t🔧 [{self.name.upper()}] Starting...")
-        result = self._execute(task_brief, context)
-        print(f"\t✅ [{self.name.upper()}] Complete.")
-        return result.model_dump() if isinstance(result, BaseModel) else result
+        result: dict[str, Any] = {}
+        async for result in self.astream(task_brief, context):
+            pass
+        return result
+
+    async def astream(
+        self, task_brief: str, context: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Like `arun`, but yields partial outputs as they are generated.
+        The last item yielded is always the complete output.
+        """
+        brief_hash = hashlib.blake2b(task_brief.encode(), digest_size=6).hexdigest()
+        log.info(
+            "🔧 [%s] Starting...", self.name.upper(),
+            extra={"event": "agent.start", "agent": self.name, "task_brief_hash": brief_hash},
+        )
+        async for result in self._aexecute_stream(task_brief, context):
+            yield result.model_dump() if isinstance(result, BaseModel) else result
+        log.info(
+            "✅ [%s] Complete.", self.name.upper(),
+            extra={"event": "agent.complete", "agent": self.name, "task_brief_hash": brief_hash},
+        )
 
-    def _execute(self, task_brief: str, context: str | None = None) -> BaseModel:
+    async def _aexecute_stream(
+        self, task_brief: str, context: str | None = None
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Streaming execution. By default there is nothing incremental to show,
+        so the finished `_aexecute` result is yielded once. Override in agents
+        whose output is worth surfacing while it is still being generated.
+        """
+        yield await self._aexecute(task_brief, context)
+
+    async def _aexecute(self, task_brief: str, context: str | None = None) -> BaseModel:
         """
         Default execution: send task to LLM with structured output parsing.
 
@@ -83,58 +143,306 @@ class BaseAgent(ABC):
         """
         user_prompt = build_agent_prompt(task_brief, context)
         messages = [
-            SystemMessage(content=self.system_prompt),
+            self._system_message,
             HumanMessage(content=user_prompt),
         ]
-        response = self.llm_structured.invoke(messages)
+        response = await self._cached_structured_invoke(messages)
         return response
 
     # ── Helpers ────────────────────────────────
 
-    def _call_with_tools(self, messages: list) -> str:
+    def _cache_key(self, messages: list) -> str:
+        """Response-cache key: the agent (system prompt, model, schema) plus every message."""
+        return hashlib.blake2b(
+            (self._cache_sig + json.dumps([m.content for m in messages])).encode()
+        ).hexdigest()
+
+    async def _cached_structured_invoke(self, messages: list) -> BaseModel:
+        """Structured LLM call backed by the persistent response cache."""
+        key = self._cache_key(messages)
+
+        hit = agent_cache.get(key, self.output_schema)
+        if hit is not None:
+            log.info(
+                "💾 [%s] Cache hit — skipping LLM call.", self.name.upper(),
+                extra={"event": "agent.cache_hit", "agent": self.name},
+            )
+            return hit
+
+        async def call() -> BaseModel:
+            result = await self.llm_structured.ainvoke(messages)
+            agent_cache.put(key, result)
+            return result
+
+        return await self._singleflight_invoke(key, call)
+
+    async def _singleflight_invoke(
+        self, key: str, coro_factory: Callable[[], Awaitable[BaseModel]]
+    ) -> BaseModel:
+        """
+        Coalesce concurrent identical calls: the first caller for `key` starts
+        the call, later callers await the same result. The call runs as its
+        own task, so cancelling one waiter doesn't cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            log.info(
+                "🔗 [%s] Identical call in flight — awaiting its result.", self.name.upper(),
+                extra={"event": "agent.singleflight", "agent": self.name},
+            )
+        return await asyncio.shield(task)
+
+    async def _acall_with_tools(self, messages: list) -> BaseModel:
         """
         Run a tool-augmented conversation loop.
 
         Sends messages to the LLM with tools bound. If the LLM requests
-        tool calls, executes them and feeds results back until the LLM
-        produces a final text response.
+        tool calls, executes them concurrently and feeds results back until
+        the LLM calls the output-schema tool, whose arguments are the final
+        structured output. No separate "structure the output" call needed.
         """
         if not self.llm_with_tools:
             raise RuntimeError(f"Agent '{self.name}' has no tools bound.")
 
-        tools_by_name = {t.name: t for t in self._get_tools()}
+        tools_by_name = self._tools_by_name
+        final_tool = self.output_schema.__name__
+        prompt = list(messages)
         max_tool_rounds = 6
+        draft = None
 
         for _ in range(max_tool_rounds):
-            response = self.llm_with_tools.invoke(messages)
+            response = await self.llm_with_tools.ainvoke(messages)
             messages.append(response)
+            self._log_token_savings(response)
 
-            # If no tool calls, we're done — return the text content
+            # Final answer delivered as a call to the output schema
+            final_call = next((c for c in response.tool_calls if c["name"] == final_tool), None)
+            if final_call is not None:
+                try:
+                    return self.output_schema.model_validate(final_call["args"])
+                except ValidationError:
+                    # Malformed final args — let the structuring call repair them
+                    draft = json.dumps(final_call["args"], default=str)
+                    break
+
+            # Plain text instead of a final structured call — stop looping
             if not response.tool_calls:
-                return response.content
-
-            # Execute each tool call and append results
-            for tool_call in response.tool_calls:
-                tool = tools_by_name.get(tool_call["name"])
-                if tool is None:
-                    tool_result = f"Error: Unknown tool '{tool_call['name']}'"
-                else:
-                    try:
-                        tool_result = tool.invoke(tool_call["args"])
-                    except Exception as e:
-                        tool_result = f"Error executing {tool_call['name']}: {e}"
+                break
 
+            # Execute all tool calls of this round concurrently, append results in order
+            results = await asyncio.gather(*[
+                self._run_tool_async(tools_by_name, tool_call)
+                for tool_call in response.tool_calls
+            ])
+            for tool_call, tool_result in zip(response.tool_calls, results):
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call["id"],
                     "content": str(tool_result),
                 })
 
-        return messages[-1].content if hasattr(messages[-1], "content") else str(messages[-1])
+        # Fallback: no valid output-schema call — structure the last answer
+        if draft is None:
+            draft = messages[-1].content if hasattr(messages[-1], "content") else str(messages[-1])
+        return await self._cached_structured_invoke([
+            *prompt,
+            HumanMessage(content=(
+                f"DRAFT ANSWER:\n{draft}\n\n"
+                "Return this as your final answer in the required structured format."
+            )),
+        ])
+
+    async def _acall_with_programmatic_tools(self, messages: list) -> BaseModel:
+        """
+        Programmatic tool calling: one LLM call plans every tool invocation as
+        a batch, all of them run concurrently, and a second call turns the
+        aggregated results into the output schema — 2 round-trips instead of
+        one per tool round. Falls back to the ReAct loop if the batch plan
+        doesn't validate.
+        """
+        if not self.llm_tool_plan:
+            raise RuntimeError(f"Agent '{self.name}' has no tools bound.")
+
+        tools_by_name = self._tools_by_name
+        catalog = "\n".join(
+            f"- {t.name}: {t.description}\n  arguments: {json.dumps(t.args)}" for t in self._tools
+        )
 
-    def _summarize_output(self, output: dict[str, Any], max_chars: int = 500) -> str:
+        # ── Call 1: plan the batch of tool calls ──
+        try:
+            plan: ToolPlan | None = await self.llm_tool_plan.ainvoke([
+                *messages,
+                HumanMessage(content=(
+                    f"AVAILABLE TOOLS:\n{catalog}\n\n"
+                    "List every tool call you need now as one batch — they will all be "
+                    "executed together and you will get every result at once."
+                )),
+            ])
+            # A None plan means the model returned nothing parseable
+            calls = [
+                {"name": call.name, "args": json.loads(call.arguments), "id": f"call_{i}"}
+                for i, call in enumerate(plan.calls)
+            ] if plan is not None else []
+        except ValueError:  # schema / JSON validation failures
+            calls = []
+
+        if not calls or not all(_valid_tool_call(tools_by_name, call) for call in calls):
+            log.info(
+                "↩️  [%s] No usable tool batch — falling back to tool loop.", self.name.upper(),
+                extra={"event": "agent.tool_plan_fallback", "agent": self.name},
+            )
+            return await self._acall_with_tools(messages)
+
+        # ── Execute the whole batch concurrently ──
+        results = await asyncio.gather(*[
+            self._run_tool_async(tools_by_name, call) for call in calls
+        ])
+        tool_results = "\n\n".join(
+            f"[{call['name']}({json.dumps(call['args'])})]\n{result}"
+            for call, result in zip(calls, results)
+        )
+
+        # ── Call 2: structured answer from the aggregated results ──
+        return await self._cached_structured_invoke([
+            *messages,
+            HumanMessage(content=(
+                f"TOOL RESULTS:\n{tool_results}\n\n"
+                "Using these results, produce your final answer."
+            )),
+        ])
+
+    async def _astream_text(
+        self, messages: list, build: Callable[[str, bool], BaseModel]
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Stream plain text from the LLM and structure it as it grows:
+        yields `build(text_so_far, False)` per chunk, then `build(text, True)`
+        as the complete output. (Structured-output streams don't emit usable
+        partials: function-call args arrive whole, and partial objects missing
+        required fields never validate.) Shares the persistent response cache
+        with `_cached_structured_invoke`.
+        """
+        key = self._cache_key(messages)
+
+        hit = agent_cache.get(key, self.output_schema)
+        if hit is not None:
+            log.info(
+                "💾 [%s] Cache hit — skipping LLM call.", self.name.upper(),
+                extra={"event": "agent.cache_hit", "agent": self.name},
+            )
+            yield hit
+            return
+
+        text = ""
+        async for chunk in self.llm.astream(messages):
+            if isinstance(chunk.content, str) and chunk.content:
+                text += chunk.content
+                yield build(text, False)
+
+        final = build(text, True)
+        yield final
+        agent_cache.put(key, final)
+
+    def _log_token_savings(self, response: Any) -> None:
+        """Report prompt tokens the provider served from its cache (re-sent prefix)."""
+        cached = cached_prompt_tokens(response)
+        if cached:
+            log.info(
+                "💾 [%s] %d prompt tokens served from provider cache.", self.name.upper(), cached,
+                extra={"event": "agent.prompt_cache", "agent": self.name, "cached_tokens": cached},
+            )
+
+    async def _run_tool_async(self, tools_by_name: dict[str, Any], tool_call: dict) -> Any:
+        """Run one tool call via its async entry point; errors become tool results."""
+        tool = tools_by_name.get(tool_call["name"])
+        if tool is None:
+            return f"Error: Unknown tool '{tool_call['name']}'"
+        try:
+            return await tool.ainvoke(tool_call["args"])
+        except Exception as e:
+            return f"Error executing {tool_call['name']}: {e}"
+
+    def _summarize_output(self, output: dict[str, Any], max_tokens: int = 125) -> str:
         """Create a concise summary of agent output for the supervisor."""
-        text = json.dumps(output, indent=2)
-        if len(text) <= max_chars:
+        text = "\n".join(_format_compact(output))
+        if estimate_tokens(text) <= max_tokens:
             return text
-        return text[:max_chars] + "\n... [truncated]"
\ No newline at end of file
+        return text[:max_tokens * CHARS_PER_TOKEN] + "\n... [truncated]"
+
+
+def _valid_tool_call(tools_by_name: dict[str, Any], call: dict) -> bool:
+    """A planned call names a bound tool and its args fit that tool's schema."""
+    tool = tools_by_name.get(call["name"])
+    if tool is None or not isinstance(call["args"], dict):
+        return False
+    schema = tool.args_schema
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        try:
+            schema.model_validate(call["args"])
+        except ValidationError:
+            return False
+    return True
+
+
+# ── Compact Serialization ─────────────────────
+# Summaries are re-sent as context to every later agent, so they use the
+# cheapest faithful encoding: YAML-style `key: value` lines, with lists of
+# uniform records as TSV (one header row). Token cost runs YAML/TSV <
+# compact JSON < indented JSON — keys, quotes and indentation whitespace
+# dominate pretty-printed JSON.
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return str(value)
+
+
+def _is_record_list(items: list) -> bool:
+    """Non-empty list of dicts sharing one key set with scalar values — TSV-able."""
+    if not items or not all(isinstance(item, dict) and item for item in items):
+        return False
+    keys = list(items[0])
+    return all(
+        list(item) == keys and not any(isinstance(v, (dict, list)) for v in item.values())
+        for item in items
+    )
+
+
+def _format_list(items: list, indent: str) -> list[str]:
+    if _is_record_list(items):
+        rows = ["\t".join(items[0])]
+        rows += [
+            "\t".join(_scalar(v).replace("\t", " ").replace("\n", " ") for v in item.values())
+            for item in items
+        ]
+        return [indent + row for row in rows]
+    return [indent + "- " + _scalar(item).replace("\n", " ") for item in items]
+
+
+def _format_compact(value: Any, indent: str = "") -> list[str]:
+    """Render a JSON-like value as YAML-style lines (record lists as TSV)."""
+    if not isinstance(value, dict):
+        return [indent + _scalar(value)]
+
+    lines = []
+    for key, item in value.items():
+        if isinstance(item, dict) and item:
+            lines.append(f"{indent}{key}:")
+            lines.extend(_format_compact(item, indent + "  "))
+        elif isinstance(item, list) and item:
+            lines.append(f"{indent}{key}:")
+            lines.extend(_format_list(item, indent + "  "))
+        elif isinstance(item, str) and "\n" in item:
+            lines.append(f"{indent}{key}: |")
+            lines.extend(f"{indent}  {line}" for line in item.splitlines())
+        else:
+            lines.append(f"{indent}{key}: {_scalar(item)}")
+    return lines
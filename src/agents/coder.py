@@ -6,47 +6,43 @@ Returns structured CoderOutput with code, explanation, and dependencies.
 
 from __future__ import annotations
 
-from langchain_core.messages import HumanMessage, SystemMessage
+import asyncio
+
+from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
-from pydantic import BaseModel
 
 from agents.base import BaseAgent
+from agents.tools.sandbox import run_python
 from config.prompts import CODER_SYSTEM, build_agent_prompt
+from config.settings import PYTHON_EXEC_TIMEOUT
 from state.schemas import CoderOutput
 
 
 # ── Optional Tools ────────────────────────────
 
 @tool
-def execute_python(code: str) -> str:
+async def execute_python(code: str) -> str:
     """
     Execute a Python code snippet in a sandboxed environment and return stdout/stderr.
     Use this to test code before finalizing your output.
     Only use for short validation snippets — not full programs.
     """
-    import io
-    import contextlib
-
-    stdout_capture = io.StringIO()
-    stderr_capture = io.StringIO()
-
     try:
-        with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
-            exec(code, {"__builtins__": __builtins__}, {})
-
-        stdout = stdout_capture.getvalue()
-        stderr = stderr_capture.getvalue()
-
-        output_parts = []
-        if stdout:
-            output_parts.append(f"STDOUT:\n{stdout}")
-        if stderr:
-            output_parts.append(f"STDERR:\n{stderr}")
-        return "\n".join(output_parts) if output_parts else "Code executed successfully (no output)."
-
+        stdout, stderr, error = await run_python(code)
+    except asyncio.TimeoutError:
+        return f"EXECUTION ERROR: TimeoutError: snippet exceeded {PYTHON_EXEC_TIMEOUT}s"
     except Exception as e:
         return f"EXECUTION ERROR: {type(e).__name__}: {e}"
 
+    output_parts = []
+    if stdout:
+        output_parts.append(f"STDOUT:\n{stdout}")
+    if stderr:
+        output_parts.append(f"STDERR:\n{stderr}")
+    if error:
+        output_parts.append(f"EXECUTION ERROR: {error}")
+    return "\n".join(output_parts) if output_parts else "Code executed successfully (no output)."
+
 
 class CoderAgent(BaseAgent):
     name = "coder"
@@ -62,45 +58,32 @@ class CoderAgent(BaseAgent):
             return [execute_python]
         return []
 
-    def _execute(self, task_brief: str, context: str | None = None) -> CoderOutput:
+    async def _aexecute(self, task_brief: str, context: str | None = None) -> CoderOutput:
         """
-        Two-phase execution:
-        1. If tools enabled — draft and optionally test code via execute_python.
-        2. Parse final output into structured CoderOutput.
+        If tools are enabled, draft and optionally test code via execute_python,
+        then return the solution by calling the CoderOutput tool. Otherwise
+        generate the structured CoderOutput directly.
         """
         user_prompt = build_agent_prompt(task_brief, context)
 
         if self.enable_execution and self.llm_with_tools:
-            # ── Phase 1: Draft with optional testing ──
+            # ── Draft with optional testing ───────
             messages = [
-                SystemMessage(content=self.system_prompt),
+                self._system_message,
                 HumanMessage(content=(
                     f"{user_prompt}\n\n"
                     "You can use the execute_python tool to test small code snippets "
-                    "before finalizing. After you're confident in the code, provide "
-                    "your complete solution with explanation."
-                )),
-            ]
-            raw_response = self._call_with_tools(messages)
-
-            # ── Phase 2: Structure the output ─────────
-            structure_messages = [
-                SystemMessage(content=(
-                    "Extract the final code solution from the following response. "
-                    "Return structured output with: the complete code, language, "
-                    "explanation of design decisions, and list of dependencies."
-                )),
-                HumanMessage(content=(
-                    f"ORIGINAL TASK: {task_brief}\n\n"
-                    f"RESPONSE:\n{raw_response}"
+                    "before finalizing. Once you're confident in the code, call the "
+                    "CoderOutput tool with the complete code, language, an explanation "
+                    "of your design decisions, and the list of dependencies."
                 )),
             ]
-            return self.llm_structured.invoke(structure_messages)
+            return await self._acall_with_tools(messages)
 
         else:
             # ── Direct structured generation (no tools) ──
             messages = [
-                SystemMessage(content=self.system_prompt),
+                self._system_message,
                 HumanMessage(content=user_prompt),
             ]
-            return self.llm_structured.invoke(messages)
\ No newline at end of file
+            return await self._cached_structured_invoke(messages)
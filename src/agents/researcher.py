@@ -1,16 +1,17 @@
 """
 Project Briareus — Researcher Agent
 Specialist agent for web research, fact gathering, and source verification.
-Uses Tavily search for web lookups and returns structured ResearchOutput.
+Uses Tavily search (single and batched queries) for web lookups and
+returns structured ResearchOutput.
 """
 
 from __future__ import annotations
 
 from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain_core.messages import HumanMessage, SystemMessage
-from pydantic import BaseModel
+from langchain_core.messages import HumanMessage
 
 from agents.base import BaseAgent
+from agents.tools.search import web_search_batch
 from config.prompts import RESEARCHER_SYSTEM, build_agent_prompt
 from config.settings import TAVILY_MAX_RESULTS
 from state.schemas import ResearchOutput
@@ -21,48 +22,35 @@ class ResearcherAgent(BaseAgent):
     system_prompt = RESEARCHER_SYSTEM
     output_schema = ResearchOutput
 
+    def __init__(self, **kwargs):
+        # Built once per agent — the search client is reused across every call
+        self._web_search = TavilySearchResults(
+            max_results=TAVILY_MAX_RESULTS,
+            name="web_search",
+            description="Search the web for current information. Input should be a search query string.",
+        )
+        super().__init__(**kwargs)
+
     def _get_tools(self) -> list:
-        return [
-            TavilySearchResults(
-                max_results=TAVILY_MAX_RESULTS,
-                name="web_search",
-                description="Search the web for current information. Input should be a search query string.",
-            )
-        ]
+        return [self._web_search, web_search_batch]
 
-    def _execute(self, task_brief: str, context: str | None = None) -> ResearchOutput:
+    async def _aexecute(self, task_brief: str, context: str | None = None) -> ResearchOutput:
         """
-        Two-phase execution:
-        1. Tool phase — search the web using tools to gather raw information.
-        2. Synthesis phase — parse raw findings into structured ResearchOutput.
+        Research searches are usually independent, so plan them as one batch,
+        run them concurrently, and structure the combined results
+        (programmatic tool calling, with the ReAct loop as fallback).
         """
-        # ── Phase 1: Search with tools ────────────
         user_prompt = build_agent_prompt(task_brief, context)
         messages = [
-            SystemMessage(content=self.system_prompt),
+            self._system_message,
             HumanMessage(content=(
                 f"{user_prompt}\n\n"
                 "Use the web_search tool to find relevant information. "
-                "Search multiple queries if needed for thoroughness. "
-                "After gathering information, provide a comprehensive summary of your findings."
-            )),
-        ]
-
-        raw_findings = self._call_with_tools(messages)
-
-        # ── Phase 2: Structure the output ─────────
-        structure_messages = [
-            SystemMessage(content=(
-                "You are a research analyst. Convert the following raw research findings "
-                "into a structured format with: key findings (list), sources (URLs), "
-                "confidence score (0-1), and any information gaps."
-            )),
-            HumanMessage(content=(
-                f"ORIGINAL TASK: {task_brief}\n\n"
-                f"RAW FINDINGS:\n{raw_findings}\n\n"
-                "Structure these findings."
+                "Search multiple queries if needed for thoroughness — when you know "
+                "them upfront, send them together in one web_search_batch call. "
+                "Your final answer is a ResearchOutput with your key findings, "
+                "source URLs, a confidence score (0-1), and any information gaps."
             )),
         ]
 
-        result = self.llm_structured.invoke(structure_messages)
-        return result
\ No newline at end of file
+        return await self._acall_with_programmatic_tools(messages)
@@ -0,0 +1,32 @@
+"""
+Project Briareus — Agent Tools
+Shared LangChain tools used by the specialist agents.
+Tool modules are imported on first use, so loading one tool (e.g. the
+sandbox) never drags in another's dependencies (e.g. Tavily).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "web_search_batch": "agents.tools.search:web_search_batch",
+    "run_python": "agents.tools.sandbox:run_python",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook: import tools on first attribute access."""
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name].split(":")
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "web_search_batch",
+    "run_python",
+]
@@ -0,0 +1,184 @@
+"""
+Project Briareus — Python Sandbox
+Pre-warmed worker processes that run the coder agent's test snippets outside
+the orchestrator's interpreter and off its event loop, so several snippets
+can execute in parallel. Each worker runs one snippet at a time, so a
+snippet that times out is handled by killing its own worker only. Worker
+start-up (a spawn re-imports the app) happens before the timeout starts.
+Blocking pipe and spawn work runs on a pool sized to the workers, never on
+the event loop's default executor that LangGraph's sync nodes share.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import importlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from config.settings import PYTHON_EXEC_TIMEOUT, PYTHON_EXEC_WORKERS
+
+
+_TASKS_PER_WORKER = 50   # recycle workers so leaked state (imports, sys tweaks) can't pile up
+_PREWARM_MODULES = ("json", "math", "re", "collections", "itertools", "functools", "datetime", "numpy")
+
+# Explicit spawn: fork would copy the orchestrator's threads and open connections
+_MP = multiprocessing.get_context("spawn")
+
+
+# ── Worker side ───────────────────────────────
+
+def _worker_init() -> None:
+    """Pay common import costs once per worker instead of once per snippet."""
+    for name in _PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def _run_code_in_worker(code: str) -> tuple[str, str, str | None]:
+    """
+    Execute `code` in fresh globals with stdout/stderr redirected at the file
+    descriptor level (also catches output from C extensions and subprocesses).
+    Returns: (stdout, stderr, exception_repr or None)
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_out, saved_err = os.dup(1), os.dup(2)
+
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        error = None
+        try:
+            exec(code, {"__builtins__": builtins, "__name__": "__main__"})
+        except (Exception, SystemExit) as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_out, 1)
+            os.dup2(saved_err, 2)
+            os.close(saved_out)
+            os.close(saved_err)
+
+        out.seek(0)
+        err.seek(0)
+        return out.read().decode(errors="replace"), err.read().decode(errors="replace"), error
+
+
+def _worker_main(conn) -> None:
+    """Worker loop: warm up, report ready, then run snippets until the pipe closes."""
+    _worker_init()
+    conn.send("ready")
+    while True:
+        try:
+            code = conn.recv()
+        except EOFError:
+            return
+        conn.send(_run_code_in_worker(code))
+
+
+# ── Orchestrator side ─────────────────────────
+
+class _Worker:
+    """One sandbox process and its pipe. Blocking methods run in a thread."""
+
+    def __init__(self) -> None:
+        self.conn, child = _MP.Pipe()
+        self.process = _MP.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.tasks = 0
+
+    def wait_ready(self) -> None:
+        if self.conn.recv() != "ready":
+            raise RuntimeError("sandbox worker failed to start")
+
+    def call(self, code: str) -> tuple[str, str, str | None]:
+        self.conn.send(code)
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.conn.close()
+
+
+_lock = threading.Lock()
+_idle: list[_Worker] = []
+# One thread per concurrent snippet — slot holders never wait on each other's threads
+_executor = ThreadPoolExecutor(max_workers=PYTHON_EXEC_WORKERS, thread_name_prefix="briareus-sandbox")
+# Concurrent-snippet slots, one semaphore per event loop (asyncio primitives are loop-bound)
+_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def _checkout() -> _Worker:
+    """An idle live worker, or a freshly started one once it is warmed up."""
+    with _lock:
+        while _idle:
+            worker = _idle.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.kill()
+    worker = _Worker()
+    try:
+        worker.wait_ready()
+    except BaseException:
+        worker.kill()
+        raise
+    return worker
+
+
+def _checkin(worker: _Worker) -> None:
+    """Return a worker to the idle list, retiring it after _TASKS_PER_WORKER snippets."""
+    worker.tasks += 1
+    if worker.tasks >= _TASKS_PER_WORKER:
+        worker.kill()
+        return
+    with _lock:
+        _idle.append(worker)
+
+
+def _checkin_abandoned(future: Future) -> None:
+    """Done-callback for a checkout whose caller was cancelled: keep the worker pooled."""
+    if not future.cancelled() and future.exception() is None:
+        _checkin(future.result())
+
+
+async def run_python(code: str) -> tuple[str, str, str | None]:
+    """
+    Run `code` in a sandbox worker without blocking the event loop.
+    Raises asyncio.TimeoutError if the snippet itself runs longer than
+    PYTHON_EXEC_TIMEOUT seconds; only that snippet's worker is killed.
+    """
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(PYTHON_EXEC_WORKERS)
+
+    async with slots:
+        # Outside the timeout: a cold worker may take a while to spawn and warm up
+        checkout = _executor.submit(_checkout)
+        try:
+            worker = await asyncio.wrap_future(checkout)
+        except asyncio.CancelledError:
+            # The spawn thread keeps going — pool the worker once it is up
+            checkout.add_done_callback(_checkin_abandoned)
+            raise
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(_executor, worker.call, code),
+                timeout=PYTHON_EXEC_TIMEOUT,
+            )
+        except BaseException:
+            worker.kill()   # stuck, dead, or cancelled mid-snippet — never reuse it
+            raise
+        _checkin(worker)
+        return result
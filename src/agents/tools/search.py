@@ -0,0 +1,76 @@
+"""
+Project Briareus — Search Tools
+Batched web search: one tool call fans several Tavily queries out
+concurrently and returns a single merged result set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+
+from langchain_core.tools import tool
+from tavily import AsyncTavilyClient
+
+from config.settings import TAVILY_API_KEY, TAVILY_MAX_RESULTS
+
+
+_BATCH_CONCURRENCY = 5      # concurrent Tavily requests per batch
+_RESULT_CACHE_SIZE = 256    # LRU entries, shared by every agent in the process
+
+_client: AsyncTavilyClient | None = None
+_results: OrderedDict[tuple[str, int], list[dict]] = OrderedDict()
+
+
+def _get_client() -> AsyncTavilyClient:
+    global _client
+    if _client is None:
+        _client = AsyncTavilyClient(api_key=TAVILY_API_KEY or None)
+    return _client
+
+
+async def _search(query: str, max_results: int, semaphore: asyncio.Semaphore) -> list[dict]:
+    """Single Tavily query behind the shared LRU cache on (query, max_results)."""
+    key = (" ".join(query.lower().split()), max_results)
+    if key in _results:
+        _results.move_to_end(key)
+        return _results[key]
+
+    async with semaphore:
+        response = await _get_client().search(query, max_results=max_results)
+
+    results = [
+        {"query": query, "title": r.get("title"), "url": r.get("url"), "content": r.get("content")}
+        for r in response.get("results", [])
+    ]
+    _results[key] = results
+    if len(_results) > _RESULT_CACHE_SIZE:
+        _results.popitem(last=False)
+    return results
+
+
+@tool
+async def web_search_batch(queries: list[str]) -> list[dict]:
+    """
+    Search the web for several queries at once and return the merged results.
+    Prefer this over repeated web_search calls whenever you know more than one
+    query upfront. Each result has: query, title, url, content.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    batches = await asyncio.gather(
+        *[_search(q, TAVILY_MAX_RESULTS, semaphore) for q in queries],
+        return_exceptions=True,
+    )
+
+    # Merge, dropping pages already returned for an earlier query
+    merged, seen_urls = [], set()
+    for query, batch in zip(queries, batches):
+        if isinstance(batch, Exception):
+            merged.append({"query": query, "error": f"{type(batch).__name__}: {batch}"})
+            continue
+        for result in batch:
+            if result["url"] in seen_urls:
+                continue
+            seen_urls.add(result["url"])
+            merged.append(result)
+    return merged
@@ -7,8 +7,12 @@ Returns structured WriterOutput.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
+from langchain_core.messages import HumanMessage
+
 from agents.base import BaseAgent
-from config.prompts import WRITER_SYSTEM
+from config.prompts import WRITER_STREAM_FORMAT, WRITER_SYSTEM, build_agent_prompt
 from state.schemas import WriterOutput
 
 
@@ -23,5 +27,48 @@ class WriterAgent(BaseAgent):
     system_prompt = WRITER_SYSTEM
     output_schema = WriterOutput
 
-    # No tools needed — uses the default _execute from BaseAgent
-    # which sends the task brief + context to the structured LLM.
\ No newline at end of file
+    # No tools needed — uses the default _aexecute from BaseAgent
+    # which sends the task brief + context to the structured LLM.
+
+    async def _aexecute_stream(
+        self, task_brief: str, context: str | None = None
+    ) -> AsyncIterator[WriterOutput]:
+        """Long prose — stream it as plain text, yielding growing WriterOutputs."""
+        messages = [
+            self._system_message,
+            HumanMessage(content=build_agent_prompt(task_brief, context) + WRITER_STREAM_FORMAT),
+        ]
+        async for partial in self._astream_text(messages, _build_output):
+            yield partial
+
+
+_HEADERS = ("FORMAT:", "SUMMARY:")
+
+
+def _build_output(text: str, done: bool) -> WriterOutput:
+    """
+    Split streamed text into a WriterOutput: the "FORMAT:" and "SUMMARY:"
+    header lines, then the content. A header the model skipped stays empty
+    (format falls back to the schema default), so the reviewer's checks see
+    it. Partials skip validation; the final output is validated.
+    """
+    fields: dict[str, str] = {}
+    rest = text.lstrip()
+    while rest:
+        line, newline, tail = rest.partition("\n")
+        key = line.strip().upper()
+        header = next((h for h in _HEADERS if key.startswith(h)), None)
+        if header is None and not newline and not done and any(h.startswith(key) for h in _HEADERS):
+            rest = ""   # a header prefix is still arriving
+            break
+        if header is None or header in fields:
+            break
+        fields[header] = line.strip()[len(header):].strip()
+        rest = tail   # empty while still inside the header line
+    content = rest.lstrip("\n")
+    summary = fields.get("SUMMARY:", "")
+    fmt = fields.get("FORMAT:") or WriterOutput.model_fields["format"].default
+
+    if not done:
+        return WriterOutput.model_construct(content=content, format=fmt, summary=summary)
+    return WriterOutput(content=content, format=fmt, summary=summary)
@@ -0,0 +1,115 @@
+"""
+Project Briareus — Agent Response Cache
+Persistent SQLite store for structured agent outputs, so replays and
+repeated (task brief, context) pairs skip the LLM round-trip entirely.
+Each agent run is wrapped in a `scope()` that records the keys it used, so
+an output the reviewer rejects can be evicted, and that can skip cached
+reads (a retry must never be answered with the output it is retrying).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from config.settings import AGENT_CACHE_ENABLED, CACHE_DIR
+
+
+_DB_PATH = Path(CACHE_DIR) / "agent.db"
+
+# One shared connection; parallel agent branches may hit it from several threads
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+
+
+@dataclass
+class _Scope:
+    read: bool
+    keys: list[str] = field(default_factory=list)
+
+
+_scope: ContextVar[_Scope | None] = ContextVar("agent_cache_scope", default=None)
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, schema TEXT NOT NULL, value TEXT NOT NULL)"
+        )
+    return _conn
+
+
+def get(key: str, schema: type[BaseModel]) -> BaseModel | None:
+    """Return the cached output for `key` parsed as `schema`, or None on a miss."""
+    if not AGENT_CACHE_ENABLED:
+        return None
+
+    # Every lookup precedes the put for the same key, so recording here covers both
+    current = _scope.get()
+    if current is not None:
+        current.keys.append(key)
+        if not current.read:
+            return None
+
+    with _lock:
+        row = _connection().execute(
+            "SELECT value FROM responses WHERE key = ? AND schema = ?",
+            (key, schema.__name__),
+        ).fetchone()
+
+    if row is None:
+        return None
+    try:
+        return schema.model_validate_json(row[0])
+    except ValidationError:
+        return None  # schema changed since the entry was written — treat as a miss
+
+
+def put(key: str, value: BaseModel) -> None:
+    """Store a structured output under `key`."""
+    if not AGENT_CACHE_ENABLED:
+        return
+
+    with _lock:
+        conn = _connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, schema, value) VALUES (?, ?, ?)",
+            (key, type(value).__name__, value.model_dump_json()),
+        )
+        conn.commit()
+
+
+def evict(keys: list[str]) -> None:
+    """Drop the entries for `keys` (outputs a review rejected)."""
+    if not AGENT_CACHE_ENABLED or not keys:
+        return
+
+    with _lock:
+        conn = _connection()
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in keys])
+        conn.commit()
+
+
+@contextmanager
+def scope(*, read: bool = True) -> Iterator[list[str]]:
+    """
+    Track the cache keys used by one agent run; yields that (growing) list.
+    With read=False, lookups miss, so the LLM is called and the fresh
+    output overwrites the old entry.
+    """
+    token = _scope.set(_Scope(read=read))
+    try:
+        yield _scope.get().keys
+    finally:
+        _scope.reset(token)
@@ -0,0 +1,94 @@
+"""
+Project Briareus — Plan Template Cache
+Reuses prior plans for recurring tasks so the planner's supervisor-model call
+can be skipped. Tasks are normalized (case-folded, whitespace collapsed)
+into a signature, and only an identical signature hits: every character
+counts — word order, numbers, operators, any script — so "celsius to
+fahrenheit" never reuses the plan for "fahrenheit to celsius". Signatures
+are scoped to the planner's model, prompt and step cap, so changing any of
+them never replays a plan made under the old settings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from config.prompts import PLANNER_SYSTEM
+from config.settings import CACHE_DIR, MAX_PLAN_STEPS, PLAN_CACHE_ENABLED, SUPERVISOR_MODEL
+
+
+_DB_PATH = Path(CACHE_DIR) / "plans.db"
+
+# Planner config folded into every key (cf. BaseAgent._cache_sig)
+_CONFIG_SIG = hashlib.blake2b(
+    f"{SUPERVISOR_MODEL}\0{PLANNER_SYSTEM}\0{MAX_PLAN_STEPS}".encode()
+).hexdigest()[:16]
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_entries: dict[str, str] | None = None   # signature → plan_json
+
+
+def normalize(task: str) -> str:
+    """Canonical task signature: the case-folded task with whitespace collapsed."""
+    return " ".join(task.casefold().split())
+
+
+def _key(task: str) -> str | None:
+    """Cache key for `task`, or None for a blank task (never cached)."""
+    signature = normalize(task)
+    return f"{_CONFIG_SIG}:{signature}" if signature else None
+
+
+def _load() -> dict[str, str]:
+    global _conn, _entries
+    if _entries is None:
+        _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        # Separate table from the older ones, whose stripped, unscoped
+        # signatures can't be compared with these keys
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS plan_templates_v2 "
+            "(signature TEXT PRIMARY KEY, plan TEXT NOT NULL)"
+        )
+        _entries = dict(_conn.execute("SELECT signature, plan FROM plan_templates_v2"))
+    return _entries
+
+
+def get(task: str, schema: type[BaseModel]) -> BaseModel | None:
+    """Return the stored plan for `task`'s exact signature, or None."""
+    key = _key(task)
+    if not PLAN_CACHE_ENABLED or key is None:
+        return None
+
+    with _lock:
+        plan_json = _load().get(key)
+
+    if plan_json is None:
+        return None
+    try:
+        return schema.model_validate_json(plan_json)
+    except ValidationError:
+        return None
+
+
+def put(task: str, plan: BaseModel) -> None:
+    """Store `plan` as the template for this task's signature."""
+    key = _key(task)
+    if not PLAN_CACHE_ENABLED or key is None:
+        return
+
+    plan_json = plan.model_dump_json()
+    with _lock:
+        entries = _load()
+        _conn.execute(
+            "INSERT OR REPLACE INTO plan_templates_v2 (signature, plan) VALUES (?, ?)",
+            (key, plan_json),
+        )
+        _conn.commit()
+        entries[key] = plan_json
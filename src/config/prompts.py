@@ -26,6 +26,8 @@ Rules:
 3. Minimize the number of steps — don't create unnecessary work.
 4. If the task is simple enough for one agent, create a single-step plan.
 5. Always think about the logical order: research before code, code before documentation.
+6. Also write first_step: the task_brief for the first step with no dependencies, addressed
+   directly to its agent, so execution can begin without a separate routing call.
 """
 
 ROUTER_SYSTEM = """You are the Routing Module of Briareus, a multi-agent orchestrator.
@@ -92,7 +94,7 @@ Rules:
 RESEARCHER_SYSTEM = """You are the Research Specialist of Briareus, a multi-agent system.
 
 Your capabilities:
-- Search the web for current information
+- Search the web for current information (web_search, or web_search_batch for several queries)
 - Gather and cross-reference facts from multiple sources
 - Identify knowledge gaps and conflicting information
 
@@ -103,6 +105,8 @@ Rules:
 4. If you can't find reliable information on something, say so explicitly in your gaps.
 5. Rate your confidence honestly — don't inflate it.
 6. Prefer primary sources over secondary ones.
+7. When you know several queries upfront, run them in one web_search_batch call
+   instead of repeated web_search calls.
 """
 
 CODER_SYSTEM = """You are the Coding Specialist of Briareus, a multi-agent system.
@@ -136,17 +140,69 @@ Rules:
 5. If the task brief specifies a format or tone, follow it exactly.
 """
 
+# The writer streams plain text (structured output arrives in one piece), so
+# the summary travels as a first line that is split off at the end.
+WRITER_STREAM_FORMAT = """
+
+Respond in plain text, not JSON. Start with exactly two header lines:
+FORMAT: <the output format — markdown, report, email, etc.>
+SUMMARY: <a one-line summary of what you wrote>
+Everything after them is the content itself."""
+
 # ──────────────────────────────────────────────
 # Prompt Builders (for dynamic context injection)
 # ──────────────────────────────────────────────
+# Static scaffolding is evaluated once at import; builders only splice in
+# the variable parts. Templates carry no indentation — leading whitespace
+# would be sent (and billed) on every call.
 
-def build_planner_prompt(task: str) -> str:
-    return f"""Break down the following user task into subtasks and assign each to the appropriate agent.
+_PLANNER_TMPL = """Break down the following user task into subtasks and assign each to the appropriate agent.
 
 USER TASK:
 {task}
 
-Respond with a structured plan including: goal, subtasks (each with id, description, agent, depends_on), and reasoning."""
+Respond with a structured plan including: goal, subtasks (each with id, description, agent, depends_on), reasoning, and first_step (step_id and task_brief)."""
+
+_ROUTER_TASK = "ORIGINAL TASK:\n"
+_ROUTER_PLAN = "\n\nPLAN:\n"
+_ROUTER_PROGRESS = "\n\nPROGRESS SO FAR:\n"
+_ROUTER_LAST_OUTPUT = "\n\nLAST AGENT OUTPUT (summary):\n"
+_ROUTER_LAST_REVIEW = "\n\nREVIEW OF LAST OUTPUT:\n"
+_ROUTER_DECIDE = (
+    "\n\nDecide which agent to call next (or 'synthesize' to finish). "
+    "Provide a concise task_brief for the chosen agent."
+)
+
+_REVIEWER_TMPL = """Evaluate this {agent_name} output against its task brief.
+
+TASK BRIEF:
+{task_brief}
+
+{agent_label} OUTPUT:
+{agent_output}
+
+Iterations used: {iteration_count}/{max_iterations}{budget_note}
+
+Rate the output as "good", "acceptable", or "needs_retry" with specific feedback."""
+
+_REVIEWER_BUDGET_NOTE = "\n⚠️ ITERATION BUDGET IS LOW — be lenient unless the output is fundamentally broken."
+
+_SYNTHESIZER_TMPL = """Synthesize the following agent outputs into a single, coherent response to the user's task.
+
+ORIGINAL TASK:
+{task}
+
+AGENT OUTPUTS:
+{all_outputs}
+
+Produce a polished, unified response that directly addresses what the user asked for."""
+
+_AGENT_PROMPT_TASK = "TASK:\n"
+_AGENT_PROMPT_CTX = "\n\nCONTEXT FROM PRIOR STEPS:\n"
+
+
+def build_planner_prompt(task: str) -> str:
+    return _PLANNER_TMPL.format(task=task)
 
 
 def build_router_prompt(
@@ -156,17 +212,13 @@ def build_router_prompt(
     last_output_summary: str | None = None,
     last_review_summary: str | None = None,
 ) -> str:
-    parts = [
-        f"ORIGINAL TASK:\n{task}",
-        f"\nPLAN:\n{plan_summary}",
-        f"\nPROGRESS SO FAR:\n{progress_summary}",
-    ]
+    parts = [_ROUTER_TASK, task, _ROUTER_PLAN, plan_summary, _ROUTER_PROGRESS, progress_summary]
     if last_output_summary:
-        parts.append(f"\nLAST AGENT OUTPUT (summary):\n{last_output_summary}")
+        parts += (_ROUTER_LAST_OUTPUT, last_output_summary)
     if last_review_summary:
-        parts.append(f"\nREVIEW OF LAST OUTPUT:\n{last_review_summary}")
-    parts.append("\nDecide which agent to call next (or 'synthesize' to finish). Provide a concise task_brief for the chosen agent.")
-    return "\n".join(parts)
+        parts += (_ROUTER_LAST_REVIEW, last_review_summary)
+    parts.append(_ROUTER_DECIDE)
+    return "".join(parts)
 
 
 def build_reviewer_prompt(
@@ -176,38 +228,23 @@ def build_reviewer_prompt(
     iteration_count: int,
     max_iterations: int,
 ) -> str:
-    budget_note = ""
-    if iteration_count >= max_iterations - 2:
-        budget_note = "\n⚠️ ITERATION BUDGET IS LOW — be lenient unless the output is fundamentally broken."
-    
-    return f"""Evaluate this {agent_name} output against its task brief.
-
-        TASK BRIEF:
-        {task_brief}
-
-        {agent_name.upper()} OUTPUT:
-        {agent_output}
-
-        Iterations used: {iteration_count}/{max_iterations}{budget_note}
-
-        Rate the output as "good", "acceptable", or "needs_retry" with specific feedback."""
+    return _REVIEWER_TMPL.format(
+        agent_name=agent_name,
+        agent_label=agent_name.upper(),
+        task_brief=task_brief,
+        agent_output=agent_output,
+        iteration_count=iteration_count,
+        max_iterations=max_iterations,
+        budget_note=_REVIEWER_BUDGET_NOTE if iteration_count >= max_iterations - 2 else "",
+    )
 
 
 def build_synthesizer_prompt(task: str, all_outputs: str) -> str:
-    return f"""Synthesize the following agent outputs into a single, coherent response to the user's task.
-
-    ORIGINAL TASK:
-    {task}
-
-    AGENT OUTPUTS:
-    {all_outputs}
-
-    Produce a polished, unified response that directly addresses what the user asked for."""
+    return _SYNTHESIZER_TMPL.format(task=task, all_outputs=all_outputs)
 
 
 def build_agent_prompt(task_brief: str, context: str | None = None) -> str:
     """Generic prompt builder for any sub-agent."""
-    parts = [f"TASK:\n{task_brief}"]
     if context:
-        parts.append(f"\nCONTEXT FROM PRIOR STEPS:\n{context}")
-    return "\n".join(parts)
\ No newline at end of file
+        return _AGENT_PROMPT_TASK + task_brief + _AGENT_PROMPT_CTX + context
+    return _AGENT_PROMPT_TASK + task_brief
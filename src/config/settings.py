@@ -18,19 +18,41 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
 # Model Configuration
 # ──────────────────────────────────────────────
 SUPERVISOR_MODEL = os.getenv("SUPERVISOR_MODEL", "gemini-2.5-pro")
-AGENT_MODEL = os.getenv("AGENT_MODEL", "gemini-2.0-flash")
+AGENT_MODEL = os.getenv("AGENT_MODEL", "gemini-2.0-flash")   # very cheap: $0.10 in / $0.40 out per 1M tokens
 
 SUPERVISOR_TEMPERATURE = 0.2    # low temp for reliable routing decisions
 AGENT_TEMPERATURE = 0.4         # slightly higher for creative agent work
 
+# Prompt caching: "implicit" (Gemini prefix caching) or "ephemeral" (cache_control blocks)
+PROMPT_CACHE = os.getenv("PROMPT_CACHE", "implicit")
+PROMPT_CACHE_MIN_TOKENS = 1024  # providers won't cache shorter prefixes
+
 # ──────────────────────────────────────────────
 # Orchestrator Limits
 # ──────────────────────────────────────────────
 MAX_ITERATIONS = int(os.getenv("MAX_ITERATIONS", "10"))     # total agent calls
 MAX_RETRIES_PER_STEP = int(os.getenv("MAX_RETRIES", "2"))   # retries for a single step
 MAX_PLAN_STEPS = int(os.getenv("MAX_PLAN_STEPS", "6"))      # cap on plan complexity
+MAX_CONTEXT_TOKENS = int(os.getenv("MAX_CONTEXT_TOKENS", "2048"))  # prior-output context per agent call
+ROUTER_PROGRESS_BUDGET_CHARS = int(os.getenv("ROUTER_PROGRESS_BUDGET_CHARS", "1500"))  # progress section of the router prompt
+REVIEW_SKIP_MIN_CONFIDENCE = float(os.getenv("REVIEW_SKIP_MIN_CONFIDENCE", "0.7"))  # gap-free research at or above this skips LLM review
 
 # ──────────────────────────────────────────────
 # Tool Configuration
 # ──────────────────────────────────────────────
-TAVILY_MAX_RESULTS = 5
\ No newline at end of file
+TAVILY_MAX_RESULTS = 5
+PYTHON_EXEC_WORKERS = int(os.getenv("PYTHON_EXEC_WORKERS", "4"))   # sandbox worker processes
+PYTHON_EXEC_TIMEOUT = 5.0                                           # seconds per snippet
+
+# ──────────────────────────────────────────────
+# Caching
+# ──────────────────────────────────────────────
+CACHE_DIR = os.getenv("BRIAREUS_CACHE_DIR", ".briareus/cache")
+AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE", "true").lower() == "true"
+PLAN_CACHE_ENABLED = os.getenv("PLAN_CACHE", "true").lower() == "true"
+
+# ──────────────────────────────────────────────
+# Logging
+# ──────────────────────────────────────────────
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "console")     # "console" or "json"
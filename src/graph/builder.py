@@ -3,67 +3,226 @@ Project Briareus — Graph Builder
 Constructs and compiles the LangGraph orchestration graph.
 
 Flow:
-    START → plan → route → [researcher|coder|writer] → review → route → ... → synthesize → END
+    START → plan → route ─┬→ researcher ─┐
+                          ├→ coder      ─┼→ join → review → route → ... → synthesize → END
+                          └→ writer     ─┘
+
+Independent plan steps are fanned out as one parallel wave (LangGraph `Send`)
+and fanned back in at `join` before a single review. The first hop skips
+route: plan fans out the opening wave itself.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 
 from agents import get_agent
-from state.schemas import OrchestratorState
-from supervisor.planner import plan_node
+from cache import agent_cache, plan_cache
+from config.settings import MAX_CONTEXT_TOKENS
+from llm.tokens import estimate_tokens
+from observability.log import log
+from state.schemas import AgentOutputData, OrchestratorState, Plan, WaveStep
+from supervisor.formatting import summary_line
+from supervisor.planner import apply_plan, plan_node, rebrief_plan
 from supervisor.router import route_node, route_conditional_edge
 from supervisor.reviewer import review_node
 from supervisor.synthesizer import synthesize_node
 
 
+# ──────────────────────────────────────────────
+# Planner Wrapper
+# ──────────────────────────────────────────────
+
+def _cached_plan_node(state: OrchestratorState) -> dict:
+    """
+    Plan-template cache in front of `plan_node`: a task whose normalized
+    signature equals a previously planned one reuses that plan, re-briefed
+    against the current task, and skips the supervisor-model call.
+    """
+    task = state["task"]
+    plan = plan_cache.get(task, Plan)
+    if plan is not None:
+        log.info("📋 [PLANNER] Reusing cached plan...", extra={"event": "plan.cache_hit"})
+        return apply_plan(rebrief_plan(plan, task))
+
+    update = plan_node(state)
+    plan_cache.put(task, update["plan"])
+    return update
+
+
 # ──────────────────────────────────────────────
 # Agent Wrapper Nodes
 # ──────────────────────────────────────────────
 # Each agent needs a thin wrapper that reads from / writes to OrchestratorState.
 
+def _build_context(state: OrchestratorState) -> str | None:
+    """
+    Context from prior agent outputs, capped at MAX_CONTEXT_TOKENS.
+    Every stored output (as its cached summary) is a candidate, except the
+    current step's own earlier attempts and attempts superseded by a retry.
+    Outputs of steps the current step depends on are kept first, then the
+    most recently produced (on-plan or not); the survivors are presented in
+    the order they were produced.
+    """
+    step_id = state.get("step_id")
+
+    # Latest attempt per plan step; off-plan outputs (step_id None) all count
+    candidates: dict[tuple, tuple[str, dict]] = {}
+    for name, entries in state.get("agent_outputs", {}).items():
+        for i, entry in enumerate(entries):
+            sid = entry.get("step_id")
+            if sid is not None and sid == step_id:
+                continue
+            candidates[(sid,) if sid is not None else (name, i)] = (name, entry)
+    if not candidates:
+        return None
+
+    plan = state.get("plan")
+    depends_on = set()
+    if plan and step_id is not None:
+        depends_on = next((set(st.depends_on) for st in plan.subtasks if st.id == step_id), set())
+
+    def produced(item) -> tuple[int, int]:
+        # Outputs of one wave share a seq; plan order breaks the tie
+        entry = item[1]
+        sid = entry.get("step_id")
+        return entry.get("seq", 0), -1 if sid is None else sid
+
+    def render(item) -> str:
+        name, entry = item
+        label = name if entry.get("step_id") is None else f"{name} · step {entry['step_id']}"
+        return f"[{label}]: {entry['summary']}"
+
+    ranked = sorted(
+        candidates.values(),
+        key=lambda item: (item[1].get("step_id") in depends_on, produced(item)),
+        reverse=True,
+    )
+
+    kept, budget = [], MAX_CONTEXT_TOKENS
+    for item in ranked:
+        cost = estimate_tokens(render(item))
+        if cost > budget:
+            break
+        kept.append(item)
+        budget -= cost
+
+    if len(kept) < len(ranked):
+        log.debug(
+            "✂️ Context capped at %d tokens — dropped %d older output(s).",
+            MAX_CONTEXT_TOKENS, len(ranked) - len(kept),
+            extra={"event": "context.truncated", "dropped": len(ranked) - len(kept)},
+        )
+
+    kept.sort(key=produced)
+    return "\n\n".join(render(item) for item in kept) or None
+
+
 def _make_agent_node(agent_name: str):
     """
     Factory: creates a LangGraph node function for a specialist agent.
-    The returned function reads the task brief from state, runs the agent,
-    and stores the output back in state.
+    The returned function reads the task brief from its `Send` payload,
+    runs the agent, and emits its output as a delta for the state reducer.
+    The agent (and its module's tool stack) is only built on first use.
     """
-    agent = get_agent(agent_name)
+    agent = None
 
-    def agent_node(state: OrchestratorState) -> dict:
+    async def agent_node(state: OrchestratorState) -> dict:
+        nonlocal agent
+        if agent is None:
+            agent = get_agent(agent_name)
         task_brief = state.get("current_task_brief", "")
-        iteration_count = state.get("iteration_count", 0)
-
-        # Build context from prior agent outputs (concise summaries)
-        context_parts = []
-        for name, outputs in state.get("agent_outputs", {}).items():
-            if outputs:
-                last = outputs[-1]
-                context_parts.append(f"[{name}]: {agent._summarize_output(last)}")
-                
-        context = "\n\n".join(context_parts) if context_parts else None
-
-        # Run the agent
-        result = agent.run(task_brief, context)
-
-        # Append to agent_outputs
-        existing_outputs = dict(state.get("agent_outputs", {}))
-        if agent_name not in existing_outputs:
-            existing_outputs[agent_name] = []
-        existing_outputs[agent_name] = existing_outputs[agent_name] + [result]
 
+        # Build context from prior agent outputs (summaries cached alongside each output)
+        context = _build_context(state)
+
+        # Run the agent — awaiting lets the other branches of the wave interleave.
+        # Partial outputs go to LangGraph's "custom" stream as they arrive.
+        # A retry must not be answered from the response cache with the
+        # output the reviewer just rejected, so it skips cached reads.
+        stream_writer = get_stream_writer()
+        result: dict = {}
+        retrying = state.get("retry_count", 0) > 0
+        with agent_cache.scope(read=not retrying) as cache_keys:
+            async for result in agent.astream(task_brief, context):
+                stream_writer({"agent": agent_name, "step_id": state.get("step_id"), "output": result})
+
+        # Only the delta — parallel branches are merged by the state reducer.
+        # The summary is computed once here, not on every later context build.
+        step_id = state.get("step_id")
+        entry = {
+            "data": result,
+            "summary": agent._summarize_output(result),
+            "step_id": step_id,
+            "seq": sum(len(v) for v in state.get("agent_outputs", {}).values()),
+            "cache_keys": cache_keys,
+        }
+        # The router's progress line for this output, serialized once, here
+        label = agent_name if step_id is None else f"{agent_name} · step {step_id}"
         return {
-            "agent_outputs": existing_outputs,
-            "iteration_count": iteration_count + 1,
+            "agent_outputs": {agent_name: [entry]},
+            "progress_cache": [summary_line(label, result, 300)],
+            "iteration_count": 1,
         }
 
     agent_node.__name__ = agent_name  # for LangGraph display
     return agent_node
 
 
+def _after_plan(state: OrchestratorState) -> list[Send] | str:
+    """
+    Conditional edge out of the planner. The planner sets the opening wave
+    itself, so fan it out directly; only a plan with no runnable first step
+    goes through the router.
+    """
+    if state.get("wave"):
+        return route_conditional_edge(state)
+    return "route"
+
+
+def join_node(state: OrchestratorState) -> dict:
+    """
+    Fan-in barrier. LangGraph runs this once, in the superstep after every
+    branch of the wave has finished, so review sees all of the wave's outputs.
+    Pairs each wave step with its output once, here, for the reviewer, and
+    caches the wave's "last output" summary for the router prompt.
+    """
+    outputs = state.get("agent_outputs", {})
+
+    per_agent: dict[str, list[WaveStep]] = {}
+    for step in state.get("wave", []):
+        per_agent.setdefault(step["agent"], []).append(step)
+
+    # Every branch appended exactly one output, so the newest entries of
+    # each agent's list belong to this wave — no walk over the history.
+    # Branches finish in any order, so entries are matched to steps by
+    # step_id; only off-plan steps (step_id None) pair up by position.
+    pairs: list[tuple[WaveStep, AgentOutputData]] = []
+    cache_keys: list[str] = []
+    for agent_name, steps in per_agent.items():
+        produced = outputs.get(agent_name, [])[-len(steps):]
+        by_step = {e["step_id"]: e for e in produced if e.get("step_id") is not None}
+        off_plan = iter([e for e in produced if e.get("step_id") is None])
+        for step in steps:
+            sid = step.get("step_id")
+            entry = by_step.get(sid) if sid is not None else next(off_plan, None)
+            if entry is None:
+                continue
+            pairs.append((step, entry["data"]))
+            cache_keys.extend(entry.get("cache_keys", []))
+
+    lines = [summary_line(step["agent"], data, 400) for step, data in pairs]
+    return {
+        "wave_outputs": pairs,
+        "wave_cache_keys": cache_keys,
+        "last_output_summary": "\n".join(lines) or None,
+    }
+
+
 # ──────────────────────────────────────────────
 # Graph Construction
 # ──────────────────────────────────────────────
@@ -72,41 +231,43 @@ def build_graph() -> StateGraph:
     """
     Build and compile the Briareus orchestration graph.
 
-    Returns a compiled LangGraph ready for .invoke() or .stream().
+    Returns a compiled LangGraph ready for .ainvoke() or .astream().
+    Agent nodes are async, so the graph must be driven from an event loop;
+    use .astream(..., stream_mode="custom") to receive partial agent outputs.
     """
     workflow = StateGraph(OrchestratorState)
 
     # ── Add nodes ─────────────────────────────
-    workflow.add_node("plan", plan_node)
+    workflow.add_node("plan", _cached_plan_node)
     workflow.add_node("route", route_node)
     workflow.add_node("researcher", _make_agent_node("researcher"))
     workflow.add_node("coder", _make_agent_node("coder"))
     workflow.add_node("writer", _make_agent_node("writer"))
+    workflow.add_node("join", join_node)
     workflow.add_node("review", review_node)
     workflow.add_node("synthesize", synthesize_node)
 
     # ── Add edges ─────────────────────────────
-    #  START → plan → route
+    #  START → plan → first wave (straight from the plan), or route
     workflow.set_entry_point("plan")
-    workflow.add_edge("plan", "route")
+    workflow.add_conditional_edges(
+        "plan",
+        _after_plan,
+        ["route", "researcher", "coder", "writer"],
+    )
 
-    # route → conditional branch to agent or synthesize
+    # route → fan out a wave of agents (Send), or synthesize
     workflow.add_conditional_edges(
         "route",
         route_conditional_edge,
-        {
-            "researcher": "researcher",
-            "coder": "coder",
-            "writer": "writer",
-            "synthesize": "synthesize",
-            "__end__": END,
-        },
+        ["researcher", "coder", "writer", "synthesize", END],
     )
 
-    # Each agent → review
-    workflow.add_edge("researcher", "review")
-    workflow.add_edge("coder", "review")
-    workflow.add_edge("writer", "review")
+    # Each agent → join (fan-in) → review
+    workflow.add_edge("researcher", "join")
+    workflow.add_edge("coder", "join")
+    workflow.add_edge("writer", "join")
+    workflow.add_edge("join", "review")
 
     # review → route (loop back for next decision)
     workflow.add_edge("review", "route")
@@ -0,0 +1,21 @@
+"""
+Project Briareus — LLM Factory
+Shared chat-model clients, memoized by (model, temperature), so every agent
+with the same settings reuses one client and its underlying transport.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(model: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """
+    Return the shared client for this model/temperature pair.
+    `.bind_tools()` / `.with_structured_output()` wrap it without rebuilding,
+    so callers can specialize the shared instance freely.
+    """
+    return ChatGoogleGenerativeAI(model=model, temperature=temperature)
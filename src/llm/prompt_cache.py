@@ -0,0 +1,37 @@
+"""
+Project Briareus — Prompt Caching
+Builds cache-friendly system messages and reports provider cache hits.
+
+Two modes (config.settings.PROMPT_CACHE):
+    implicit  — Gemini 2.x caches repeated request prefixes automatically;
+                we only keep the system prompt a byte-identical leading prefix.
+    ephemeral — Anthropic-style providers: the system prompt is sent as a
+                content block flagged `cache_control: ephemeral`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from langchain_core.messages import SystemMessage
+
+from config.settings import PROMPT_CACHE, PROMPT_CACHE_MIN_TOKENS
+from llm.tokens import estimate_tokens
+
+
+def system_message(text: str) -> SystemMessage:
+    """
+    System message for a stable prompt prefix. Build it once and reuse the
+    instance so every call (and every tool round) sends identical bytes.
+    """
+    if PROMPT_CACHE == "ephemeral" and estimate_tokens(text) >= PROMPT_CACHE_MIN_TOKENS:
+        return SystemMessage(content=[
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}},
+        ])
+    return SystemMessage(content=text)
+
+
+def cached_prompt_tokens(response: Any) -> int:
+    """Number of input tokens the provider served from its prompt cache."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    return (usage.get("input_token_details") or {}).get("cache_read", 0)
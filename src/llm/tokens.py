@@ -0,0 +1,15 @@
+"""
+Project Briareus — Token Estimation
+Cheap, dependency-free token counts for budgeting prompts.
+"""
+
+from __future__ import annotations
+
+# Gemini and GPT-style tokenizers average roughly four characters per token
+# on English prose and JSON; close enough for budgets and cache gates.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the number of tokens in `text`."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
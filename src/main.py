@@ -9,41 +9,102 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import sys
 
 from graph.builder import get_graph
+from observability.log import log, setup_logging
 from state.schemas import OrchestratorState
 
 
-def run(task: str) -> str:
-    """Execute a task through the Briareus orchestrator."""
+_RULE = "-" * 60
+
+
+async def _astream_run(
+    graph, initial_state: OrchestratorState, echo: bool
+) -> tuple[dict, bool]:
+    """
+    Drive the graph, consuming LangGraph's "custom" stream as it arrives:
+    with `echo`, the writer's prose goes to stderr and the synthesizer's
+    final answer to stdout, token by token.
+    Returns: (final_state, whether the final answer was streamed)
+    """
+    final_state: dict = {}
+    shown: dict[tuple, int] = {}   # (agent, step_id) → chars of prose already written
+    answer_started = False
+
+    async for mode, chunk in graph.astream(initial_state, stream_mode=["custom", "values"]):
+        if mode == "values":
+            final_state = chunk
+            continue
+        if not echo:
+            continue
+
+        if "delta" in chunk:
+            if not answer_started:
+                answer_started = True
+                sys.stdout.write(f"\n📋 FINAL OUTPUT:\n{_RULE}\n")
+            sys.stdout.write(chunk["delta"])
+            sys.stdout.flush()
+        elif chunk.get("agent") == "writer":
+            content = chunk["output"].get("content", "")
+            key = (chunk["agent"], chunk.get("step_id"))
+            start = shown.get(key, 0)
+            if len(content) < start:   # a retry of the same step started over
+                start = 0
+                sys.stderr.write("\n")
+            sys.stderr.write(content[start:])
+            sys.stderr.flush()
+            shown[key] = len(content)
+
+    if echo and answer_started:
+        sys.stdout.write("\n")
+    return final_state, answer_started
+
+
+def run(task: str, echo: bool = False) -> str:
+    """
+    Execute a task through the Briareus orchestrator.
+    With `echo`, output is rendered live as the graph streams it, and the
+    final answer is printed (streamed if the synthesizer produced it).
+    """
     graph = get_graph()
 
     initial_state: OrchestratorState = {
         "messages": [],
         "task": task,
         "plan": None,
-        "current_step": 0,
+        "plan_summary": "",
+        "completed_steps": [],
         "next_agent": "researcher",
         "current_task_brief": "",
+        "wave": [],
         "agent_outputs": {},
+        "progress_cache": [],
+        "wave_outputs": [],
+        "wave_cache_keys": [],
+        "last_output_summary": None,
         "iteration_count": 0,
         "retry_count": 0,
         "last_review": None,
         "final_output": "",
     }
 
-    print(f"\n{'='*60}")
-    print("🦾 BRIAREUS — Multi-Agent Orchestrator")
-    print(f"{'='*60}")
-    print(f"📌 Task: {task}\n")
+    log.info("🦾 BRIAREUS — Multi-Agent Orchestrator", extra={"event": "run.start"})
+    log.info("📌 Task: %s", task, extra={"event": "run.task"})
 
-    final_state = graph.invoke(initial_state)
+    final_state, streamed = asyncio.run(_astream_run(graph, initial_state, echo))
+    result = final_state.get("final_output") or "No output generated."
 
-    return final_state.get("final_output", "No output generated.")
+    if echo and not streamed:
+        print(f"\n📋 FINAL OUTPUT:\n{_RULE}")
+        print(result)
+    return result
 
 
 def main():
+    setup_logging()
+
     if len(sys.argv) > 1:
         task = " ".join(sys.argv[1:])
     else:
@@ -53,10 +114,7 @@ def main():
             print("Goodbye!")
             return
 
-    result = run(task)
-    print("\n📋 FINAL OUTPUT:")
-    print("-" * 60)
-    print(result)
+    run(task, echo=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+Project Briareus — Observability: Logging
+Status logging for the orchestrator. Callers only enqueue records (a
+QueueHandler); a QueueListener thread does the actual stderr writes, so
+concurrent agent branches never block on — or interleave through — the
+terminal. Set LOG_FORMAT=json for one JSON object per record.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from config.settings import LOG_FORMAT, LOG_LEVEL
+
+log = logging.getLogger("briareus")
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener: QueueListener | None = None
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """The orchestrator's familiar tab-indented, emoji-prefixed status lines."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"\t{record.getMessage()}"
+
+
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, message, and all `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        payload.update(
+            (key, value) for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS
+        )
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def setup_logging() -> None:
+    """Attach the queue handler and start the background writer (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(_JsonFormatter() if LOG_FORMAT == "json" else _ConsoleFormatter())
+
+    log.addHandler(QueueHandler(records))
+    log.setLevel(LOG_LEVEL)
+    log.propagate = False
+
+    _listener = QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)   # flush whatever is still queued
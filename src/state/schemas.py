@@ -5,6 +5,7 @@ Centralized state definitions and Pydantic models for structured agent I/O.
 
 from __future__ import annotations
 
+import operator
 from typing import Annotated, Literal, Optional
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
@@ -47,6 +48,58 @@ class WriterOutput(BaseModel):
     summary: str = Field(description="One-line summary of what was written")
 
 
+# ──────────────────────────────────────────────
+# Agent Output Dicts (TypedDict — as stored in state)
+# ──────────────────────────────────────────────
+# Agents validate once, via the Pydantic models above, then store plain
+# `model_dump()` dicts. These mirrors type those dicts without re-validating.
+
+class ResearchOutputTD(TypedDict):
+    """`ResearchOutput.model_dump()`."""
+    findings: list[str]
+    sources: list[str]
+    confidence: float
+    gaps: list[str]
+
+
+class CoderOutputTD(TypedDict):
+    """`CoderOutput.model_dump()`."""
+    code: str
+    language: str
+    explanation: str
+    dependencies: list[str]
+
+
+class WriterOutputTD(TypedDict):
+    """`WriterOutput.model_dump()`."""
+    content: str
+    format: str
+    summary: str
+
+
+AgentOutputData = ResearchOutputTD | CoderOutputTD | WriterOutputTD
+
+
+# ──────────────────────────────────────────────
+# Tool Planning Models (programmatic tool calling)
+# ──────────────────────────────────────────────
+
+class ToolInvocation(BaseModel):
+    """A single tool call requested up front by an agent."""
+    name: str = Field(description="Name of the tool to call")
+    arguments: str = Field(
+        description="Tool arguments as a JSON object matching the tool's listed arguments"
+    )
+
+
+class ToolPlan(BaseModel):
+    """A batch of independent tool calls, executed together in one go."""
+    calls: list[ToolInvocation] = Field(
+        default_factory=list,
+        description="Every tool call needed; they all run concurrently"
+    )
+
+
 # ──────────────────────────────────────────────
 # Supervisor Models
 # ──────────────────────────────────────────────
@@ -64,11 +117,21 @@ class SubTask(BaseModel):
     )
 
 
+class StepBrief(BaseModel):
+    """The planner's brief for the first step, so it can start without routing."""
+    step_id: int = Field(description="ID of the first step to run")
+    task_brief: str = Field(description="Concise instructions for that step's agent")
+
+
 class Plan(BaseModel):
     """The supervisor's execution plan."""
     goal: str = Field(description="High-level interpretation of the user's task")
     subtasks: list[SubTask] = Field(description="Ordered list of subtasks")
     reasoning: str = Field(description="Why this plan structure was chosen")
+    first_step: Optional[StepBrief] = Field(
+        default=None,
+        description="Task brief for the first step to run (one with no dependencies)"
+    )
 
 
 class RouteDecision(BaseModel):
@@ -102,6 +165,37 @@ class ReviewResult(BaseModel):
 
 AgentName = Literal["researcher", "coder", "writer"]
 
+
+class AgentOutputEntry(TypedDict):
+    """One stored agent output, with its context summary computed once."""
+    data: AgentOutputData                          # the agent's structured output, dumped
+    summary: str                                   # BaseAgent._summarize_output(data)
+    step_id: Optional[int]                         # plan step that produced it
+    seq: int                                       # outputs stored before this one's wave ran
+    cache_keys: list[str]                          # agent_cache keys it was read from / written to
+
+
+def _merge_agent_outputs(
+    left: dict[str, list[AgentOutputEntry]], right: dict[str, list[AgentOutputEntry]]
+) -> dict[str, list[AgentOutputEntry]]:
+    """
+    Reducer for `agent_outputs`: concatenate per-agent output lists.
+    Parallel agent branches in the same wave each emit a delta, and this
+    merges them instead of letting the last writer clobber the others.
+    """
+    merged = dict(left)
+    for name, outputs in right.items():
+        merged[name] = merged.get(name, []) + outputs
+    return merged
+
+
+class WaveStep(TypedDict):
+    """One plan step dispatched as part of a parallel wave."""
+    step_id: Optional[int]                         # SubTask.id (None if off-plan)
+    agent: AgentName
+    task_brief: str
+
+
 class OrchestratorState(TypedDict):
     """Shared state flowing through the LangGraph orchestrator."""
     messages: Annotated[list, add_messages]
@@ -109,15 +203,21 @@ class OrchestratorState(TypedDict):
     # Task & Planning
     task: str                                      # original user request
     plan: Optional[Plan]                           # supervisor's plan
-    current_step: int                              # index into plan.subtasks
+    plan_summary: str                              # router-prompt rendering of the plan
+    completed_steps: list[int]                     # SubTask ids accepted by review
 
     # Routing & Execution
     next_agent: Literal["researcher", "coder", "writer", "synthesize", "__end__"]
     current_task_brief: str                        # scoped instructions for current agent
-    agent_outputs: dict[str, list[dict]]           # keyed by agent name → list of outputs
+    wave: list[WaveStep]                           # steps dispatched in parallel this round
+    agent_outputs: Annotated[dict[str, list[AgentOutputEntry]], _merge_agent_outputs]  # agent name → outputs
+    progress_cache: Annotated[list[str], operator.add]  # one truncated line per output, appended once
+    wave_outputs: list[tuple[WaveStep, AgentOutputData]]  # the last wave's (step, output) pairs, set at join
+    wave_cache_keys: list[str]                     # agent_cache keys behind those outputs, set at join
+    last_output_summary: Optional[str]             # the last wave's outputs, set at join
 
     # Control Flow
-    iteration_count: int                           # total agent calls (loop safety)
+    iteration_count: Annotated[int, operator.add]  # total agent calls (loop safety); nodes emit deltas
     retry_count: int                               # consecutive retries for current step
     last_review: Optional[ReviewResult]            # most recent review
 
@@ -0,0 +1,32 @@
+"""
+Project Briareus — Supervisor: Prompt Formatting
+Serialization helpers for embedding agent outputs in supervisor prompts.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any) -> str:
+    """Indented JSON for prompt text (orjson: several times faster than json.dumps)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def dump_capped(obj: Any, cap: int) -> str:
+    """
+    Compact JSON cut to `cap` bytes, with "..." if anything was dropped.
+    Only the kept prefix is decoded; a multi-byte character split at the
+    cut is dropped rather than mangled.
+    """
+    raw = orjson.dumps(obj)
+    if len(raw) <= cap:
+        return raw.decode()
+    return raw[:cap].decode(errors="ignore") + "..."
+
+
+def summary_line(label: str, data: Any, limit: int) -> str:
+    """One "[label]: {...}" prompt line, with the JSON capped at `limit`."""
+    return f"[{label}]: {dump_capped(data, limit)}"
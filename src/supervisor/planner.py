@@ -6,19 +6,24 @@ with subtasks assigned to specialist agents.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.runnables import Runnable
 
 from config.prompts import PLANNER_SYSTEM, build_planner_prompt
 from config.settings import SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE, MAX_PLAN_STEPS
-from state.schemas import OrchestratorState, Plan
+from llm.factory import get_chat_model
+from observability.log import log
+from state.schemas import OrchestratorState, Plan, WaveStep
+
+
+_SYSTEM_MESSAGE = SystemMessage(content=PLANNER_SYSTEM)
 
 
-def _get_planner_llm() -> ChatGoogleGenerativeAI:
-    return ChatGoogleGenerativeAI(
-        model=SUPERVISOR_MODEL,
-        temperature=SUPERVISOR_TEMPERATURE,
-    ).with_structured_output(Plan)
+@lru_cache(maxsize=1)
+def _get_planner_llm() -> Runnable:
+    return get_chat_model(SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE).with_structured_output(Plan)
 
 
 def plan_node(state: OrchestratorState) -> dict:
@@ -26,15 +31,16 @@ def plan_node(state: OrchestratorState) -> dict:
     LangGraph node: Generate an execution plan from the user's task.
 
     Reads:  state["task"]
-    Writes: state["plan"], state["current_step"], state["iteration_count"],
-            state["retry_count"], state["agent_outputs"]
+    Writes: state["plan"], state["plan_summary"], state["completed_steps"], state["wave"],
+            state["retry_count"], and — when the plan has a step with no
+            dependencies — state["next_agent"], state["current_task_brief"]
     """
     task = state["task"]
-    print(f"\n📋 [PLANNER] Decomposing task...")
+    log.info("📋 [PLANNER] Decomposing task...", extra={"event": "plan.start"})
 
     llm = _get_planner_llm()
     messages = [
-        SystemMessage(content=PLANNER_SYSTEM),
+        _SYSTEM_MESSAGE,
         HumanMessage(content=build_planner_prompt(task)),
     ]
 
@@ -42,21 +48,86 @@ def plan_node(state: OrchestratorState) -> dict:
 
     # Enforce max plan steps
     if len(plan.subtasks) > MAX_PLAN_STEPS:
-        print(f"\t⚠️ Plan had {len(plan.subtasks)} steps, truncating to {MAX_PLAN_STEPS}")
-        plan.subtasks = plan.subtasks[:MAX_PLAN_STEPS]
+        log.warning(
+            "⚠️ Plan had %d steps, truncating to %d", len(plan.subtasks), MAX_PLAN_STEPS,
+            extra={"event": "plan.truncated"},
+        )
+        plan = plan.model_copy(update={"subtasks": plan.subtasks[:MAX_PLAN_STEPS]})
 
-    # Log the plan
-    print(f"\t🎯 Goal: {plan.goal}")
+    return apply_plan(plan)
+
+
+def apply_plan(plan: Plan) -> dict:
+    """Log a plan (fresh or cached) and build the planner's state update."""
+    # One record for the whole plan; the reasoning only at DEBUG
+    lines = [f"🎯 Goal: {plan.goal}"]
     for st in plan.subtasks:
         deps = f"(after step {st.depends_on})" if st.depends_on else ""
-        print(f"\tStep {st.id}: [{st.agent}] {st.description} {deps}")
-
-    print(f"\t💡 Reasoning: {plan.reasoning}\n")
+        lines.append(f"\tStep {st.id}: [{st.agent}] {st.description} {deps}")
+    log.info("%s", "\n".join(lines), extra={"event": "plan.ready", "steps": len(plan.subtasks)})
+    log.debug("💡 Reasoning: %s", plan.reasoning, extra={"event": "plan.reasoning"})
 
-    return {
+    update = {
         "plan": plan,
-        "current_step": 0,
-        "iteration_count": 0,
+        "plan_summary": _summarize_plan(plan),   # the plan is fixed for the run: build once
+        "completed_steps": [],
+        "wave": [],
         "retry_count": 0,
-        "agent_outputs": {},
-    }
\ No newline at end of file
+    }
+    update.update(_first_wave(plan))
+    return update
+
+
+def rebrief_plan(plan: Plan, task: str) -> Plan:
+    """
+    Re-anchor a cached plan to the task being run now. Cached steps are
+    dispatched without an LLM in between, so each brief (and the
+    first_step brief) carries the current task verbatim as the authority.
+    """
+    anchor = f"\n\n(Part of the user task: {task})"
+    subtasks = [
+        st.model_copy(update={"description": st.description + anchor})
+        for st in plan.subtasks
+    ]
+    first = plan.first_step
+    if first is not None:
+        first = first.model_copy(update={"task_brief": first.task_brief + anchor})
+    return plan.model_copy(update={"subtasks": subtasks, "first_step": first})
+
+
+def _summarize_plan(plan: Plan) -> str:
+    """Create a concise string summary of the plan for the router prompt."""
+    lines = [f"Goal: {plan.goal}"]
+    for st in plan.subtasks:
+        lines.append(f"\tStep {st.id}: [{st.agent}] {st.description}")
+    return "\n".join(lines)
+
+
+def _first_wave(plan: Plan) -> dict:
+    """
+    First dispatch straight from the plan: the opening wave (every step
+    without dependencies) is set here, so the graph skips the router on
+    the first hop. Steps run on their plan descriptions, except the one the
+    planner wrote a first_step brief for.
+    """
+    first = plan.first_step
+    ready = [st for st in plan.subtasks if not st.depends_on]
+    if not ready:
+        return {}   # no entry point (malformed dependencies) — let the router decide
+
+    def brief(st) -> str:
+        return first.task_brief if first and st.id == first.step_id else st.description
+
+    wave: list[WaveStep] = [
+        {"step_id": st.id, "agent": st.agent, "task_brief": brief(st)}
+        for st in ready
+    ]
+    log.info(
+        "⚡ Starting %s directly from the plan", ", ".join(f"step {st.id}" for st in ready),
+        extra={"event": "plan.first_wave", "steps": [st.id for st in ready]},
+    )
+    return {
+        "next_agent": wave[0]["agent"],
+        "current_task_brief": "\n".join(step["task_brief"] for step in wave),
+        "wave": wave,
+    }
@@ -6,69 +6,128 @@ whether to proceed, accept with caveats, or retry.
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.runnables import Runnable
 
+from cache import agent_cache
 from config.prompts import REVIEWER_SYSTEM, build_reviewer_prompt
 from config.settings import (
     SUPERVISOR_MODEL,
     SUPERVISOR_TEMPERATURE,
     MAX_ITERATIONS,
     MAX_RETRIES_PER_STEP,
+    REVIEW_SKIP_MIN_CONFIDENCE,
 )
-from state.schemas import OrchestratorState, ReviewResult
+from llm.factory import get_chat_model
+from observability.log import log
+from state.schemas import AgentOutputData, OrchestratorState, ReviewResult, WaveStep
+from supervisor.formatting import dumps
 
 
-def _get_reviewer_llm() -> ChatGoogleGenerativeAI:
-    return ChatGoogleGenerativeAI(
-        model=SUPERVISOR_MODEL,
-        temperature=SUPERVISOR_TEMPERATURE,
-    ).with_structured_output(ReviewResult)
+_SYSTEM_MESSAGE = SystemMessage(content=REVIEWER_SYSTEM)
 
 
-def _get_last_agent_output(state: OrchestratorState) -> tuple[str, str]:
+@lru_cache(maxsize=1)
+def _get_reviewer_llm() -> Runnable:
+    return get_chat_model(SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE).with_structured_output(ReviewResult)
+
+
+def _passes_structural_checks(agent_name: str, output: AgentOutputData) -> bool:
+    """
+    Cheap gate in front of the reviewer LLM: the output is already
+    schema-valid, so only check that it is complete and unhedged.
     """
-    Get the name and stringified output of the most recent agent call.
-    Returns: (agent_name, output_string)
+    if agent_name == "researcher":
+        return (
+            bool(output.get("findings"))
+            and output.get("confidence", 0.0) >= REVIEW_SKIP_MIN_CONFIDENCE
+            and not output.get("gaps")
+        )
+    if agent_name == "coder":
+        return bool(output.get("code", "").strip()) and bool(output.get("explanation", "").strip())
+    if agent_name == "writer":
+        return bool(output.get("content", "").strip()) and bool(output.get("summary", "").strip())
+    return False
+
+
+def _describe_wave(
+    pairs: list[tuple[WaveStep, AgentOutputData]], default_brief: str
+) -> tuple[str, str, str]:
     """
-    outputs = state.get("agent_outputs", {})
-    for agent_name in reversed(list(outputs.keys())):
-        if outputs[agent_name]:
-            last = outputs[agent_name][-1]
-            return agent_name, json.dumps(last, indent=2)
-    return "unknown", "No output available."
+    Render the wave for the reviewer prompt.
+    Returns: (agent_name, task_brief, output_string)
+    """
+    if not pairs:
+        return "unknown", default_brief, "No output available."
+
+    if len(pairs) == 1:
+        step, output = pairs[0]
+        return step["agent"], step["task_brief"], dumps(output)
+
+    agent_name = " + ".join(step["agent"] for step, _ in pairs)
+    task_brief = "\n".join(
+        f"[Step {step['step_id']} · {step['agent']}] {step['task_brief']}" for step, _ in pairs
+    )
+    agent_output = "\n\n".join(
+        f"[Step {step['step_id']} · {step['agent']}]\n{dumps(output)}"
+        for step, output in pairs
+    )
+    return agent_name, task_brief, agent_output
 
 
 def review_node(state: OrchestratorState) -> dict:
     """
-    LangGraph node: Review the most recent agent output.
+    LangGraph node: Review the outputs of the most recent wave.
+    Parallel steps share a single review; a retry re-runs the whole wave.
 
-    Reads:  state["agent_outputs"], state["current_task_brief"],
-            state["iteration_count"], state["retry_count"]
-    Writes: state["last_review"], state["retry_count"], state["current_step"]
+    Reads:  state["wave_outputs"], state["current_task_brief"],
+            state["iteration_count"], state["retry_count"], state["completed_steps"]
+    Writes: state["last_review"], state["retry_count"], state["completed_steps"]
     """
     iteration_count = state.get("iteration_count", 0)
     retry_count = state.get("retry_count", 0)
-    current_step = state.get("current_step", 0)
+    completed_steps = state.get("completed_steps", [])
 
-    agent_name, agent_output = _get_last_agent_output(state)
-    task_brief = state.get("current_task_brief", "")
+    pairs = state.get("wave_outputs", [])   # paired once by the join node
+    agent_name, task_brief, agent_output = _describe_wave(
+        pairs, state.get("current_task_brief", "")
+    )
+    wave_step_ids = [step["step_id"] for step, _ in pairs if step["step_id"] is not None]
 
-    print(f"\n🔍 [REVIEWER] Evaluating {agent_name} output...")
+    log.info(
+        "🔍 [REVIEWER] Evaluating %s output...", agent_name,
+        extra={"event": "review.start", "agent": agent_name},
+    )
 
     # ── Fast-path: skip review if budget is nearly exhausted ──
     if iteration_count >= MAX_ITERATIONS - 1:
-        print(f"  ⚡ Budget exhausted — auto-accepting output.")
+        log.info("⚡ Budget exhausted — auto-accepting output.", extra={"event": "review.auto_accept"})
         return {
-            "last_review": ReviewResult(
+            # Hard-coded, known-valid fields — skip the validation pass
+            "last_review": ReviewResult.model_construct(
                 quality="acceptable",
                 feedback="Auto-accepted due to iteration budget.",
                 should_retry=False,
+                retry_instructions=None,
             ),
             "retry_count": 0,
-            "current_step": current_step + 1,
+            "completed_steps": completed_steps + wave_step_ids,
+        }
+
+    # ── Fast-path: every output passes the structural checks ──
+    if pairs and all(_passes_structural_checks(step["agent"], output) for step, output in pairs):
+        log.info("⚡ Passed structural checks — skipping LLM review.", extra={"event": "review.structural"})
+        return {
+            "last_review": ReviewResult.model_construct(
+                quality="good",
+                feedback="Passed structural checks.",
+                should_retry=False,
+                retry_instructions=None,
+            ),
+            "retry_count": 0,
+            "completed_steps": completed_steps + wave_step_ids,
         }
 
     # ── LLM-based review ─────────────────────
@@ -83,31 +142,47 @@ def review_node(state: OrchestratorState) -> dict:
     )
 
     messages = [
-        SystemMessage(content=REVIEWER_SYSTEM),
+        _SYSTEM_MESSAGE,
         HumanMessage(content=user_prompt),
     ]
 
     review: ReviewResult = llm.invoke(messages)
 
+    # ── Never serve a rejected output from the cache again ──
+    # (checked before the retry limit can relabel it "acceptable")
+    if review.should_retry or review.quality == "needs_retry":
+        agent_cache.evict(state.get("wave_cache_keys", []))
+
     # ── Enforce retry limits ──────────────────
     if review.should_retry and retry_count >= MAX_RETRIES_PER_STEP:
-        print(f"\t⚠️ Max retries ({MAX_RETRIES_PER_STEP}) hit for this step — accepting as-is.")
-        review.should_retry = False
-        review.quality = "acceptable"
-        review.feedback += f" [Accepted after {retry_count} retries — retry limit reached.]"
+        log.warning(
+            "⚠️ Max retries (%d) hit for this step — accepting as-is.", MAX_RETRIES_PER_STEP,
+            extra={"event": "review.retry_limit"},
+        )
+        review = review.model_copy(update={
+            "should_retry": False,
+            "quality": "acceptable",
+            "feedback": review.feedback + f" [Accepted after {retry_count} retries — retry limit reached.]",
+        })
 
     # ── Update state ──────────────────────────
     new_retry_count = retry_count + 1 if review.should_retry else 0
-    new_step = current_step if review.should_retry else current_step + 1
+    new_completed = completed_steps if review.should_retry else completed_steps + wave_step_ids
 
     emoji = {"good": "✅", "acceptable": "⚠️", "needs_retry": "🔄"}
-    print(f"\t{emoji.get(review.quality, '❓')} Quality: {review.quality}")
-    print(f"\t📝 Feedback: {review.feedback[:120]}...")
+    log.info(
+        "%s Quality: %s\n\t📝 Feedback: %s...",
+        emoji.get(review.quality, "❓"), review.quality, review.feedback[:120],
+        extra={"event": "review.result", "quality": review.quality},
+    )
     if review.should_retry:
-        print(f"\t🔄 Retrying (attempt {new_retry_count}/{MAX_RETRIES_PER_STEP})...")
+        log.info(
+            "🔄 Retrying (attempt %d/%d)...", new_retry_count, MAX_RETRIES_PER_STEP,
+            extra={"event": "review.retry", "attempt": new_retry_count},
+        )
 
     return {
         "last_review": review,
         "retry_count": new_retry_count,
-        "current_step": new_step,
+        "completed_steps": new_completed,
     }
\ No newline at end of file
@@ -6,122 +6,197 @@ or whether to proceed to synthesis.
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.runnables import Runnable
+from langgraph.types import Send
 
 from config.prompts import ROUTER_SYSTEM, build_router_prompt
-from config.settings import SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE, MAX_ITERATIONS
-from state.schemas import OrchestratorState, Plan, RouteDecision
+from config.settings import (
+    SUPERVISOR_MODEL,
+    SUPERVISOR_TEMPERATURE,
+    MAX_ITERATIONS,
+    ROUTER_PROGRESS_BUDGET_CHARS,
+)
+from llm.factory import get_chat_model
+from observability.log import log
+from state.schemas import (
+    OrchestratorState,
+    ReviewResult,
+    RouteDecision,
+    SubTask,
+    WaveStep,
+)
 
 
-def _get_router_llm() -> ChatGoogleGenerativeAI:
-    return ChatGoogleGenerativeAI(
-        model=SUPERVISOR_MODEL,
-        temperature=SUPERVISOR_TEMPERATURE,
-    ).with_structured_output(RouteDecision)
+_SYSTEM_MESSAGE = SystemMessage(content=ROUTER_SYSTEM)
 
 
-def _summarize_plan(plan: Plan) -> str:
-    """Create a concise string summary of the plan for the router prompt."""
-    lines = [f"Goal: {plan.goal}"]
-    for st in plan.subtasks:
-        lines.append(f"\tStep {st.id}: [{st.agent}] {st.description}")
-    return "\n".join(lines)
+@lru_cache(maxsize=1)
+def _get_router_llm() -> Runnable:
+    return get_chat_model(SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE).with_structured_output(RouteDecision)
 
 
 def _summarize_progress(state: OrchestratorState) -> str:
-    """Summarize what has been accomplished so far."""
-    outputs = state.get("agent_outputs", {})
-    if not outputs:
+    """
+    Summarize what has been accomplished so far. Each output's line is
+    serialized once, by its agent node; the newest lines that fit in
+    ROUTER_PROGRESS_BUDGET_CHARS are kept, so the prompt doesn't grow with the plan.
+    """
+    lines = state.get("progress_cache", [])
+    if not lines:
         return "No steps completed yet."
 
-    lines = []
-    for agent_name, output_list in outputs.items():
-        for i, output in enumerate(output_list):
-            # Truncate each output summary to keep the prompt manageable
-            summary = json.dumps(output, indent=2)
-            if len(summary) > 300:
-                summary = summary[:300] + "..."
-            lines.append(f"[{agent_name} #{i+1}]: {summary}")
+    kept, used = [], 0
+    for line in reversed(lines):
+        if kept and used + len(line) > ROUTER_PROGRESS_BUDGET_CHARS:
+            break
+        kept.append(line)
+        used += len(line) + 1
 
-    return "\n".join(lines)
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.append(f"... {omitted} older outputs omitted ...")
+    return "\n".join(reversed(kept))
 
 
-def _get_last_output_summary(state: OrchestratorState) -> str | None:
-    """Get a summary of the most recent agent output."""
-    outputs = state.get("agent_outputs", {})
-    if not outputs:
-        return None
+def _ready_steps(state: OrchestratorState) -> list[SubTask]:
+    """
+    Plan steps that can run now: not yet completed, with every dependency
+    already completed. All of them are mutually independent, so they can
+    be dispatched together as one parallel wave.
+    """
+    plan = state.get("plan")
+    if not plan:
+        return []
+    done = set(state.get("completed_steps", []))
+    return [
+        st for st in plan.subtasks
+        if st.id not in done and all(d in done for d in st.depends_on)
+    ]
 
-    # Find the last output across all agents
-    last_agent = None
-    last_output = None
-    for agent_name, output_list in outputs.items():
-        if output_list:
-            last_agent = agent_name
-            last_output = output_list[-1]
 
-    if last_output is None:
+def _pending_step_id(state: OrchestratorState, agent_name: str) -> int | None:
+    """Map an LLM routing decision back onto the first pending plan step it covers."""
+    plan = state.get("plan")
+    if not plan:
         return None
+    done = set(state.get("completed_steps", []))
+    pending = [st for st in plan.subtasks if st.id not in done]
+    for st in pending:
+        if st.agent == agent_name:
+            return st.id
+    return pending[0].id if pending else None
+
+
+def _retry_wave(state: OrchestratorState, review: ReviewResult) -> list[WaveStep]:
+    """Re-dispatch the previous wave with the reviewer's feedback folded in."""
+    wave = state.get("wave", [])
+    if len(wave) == 1:
+        step = wave[0]
+        brief = review.retry_instructions or (
+            f"{step['task_brief']}\n\nREVIEWER FEEDBACK:\n{review.feedback}"
+        )
+        return [{**step, "task_brief": brief}]
+
+    # Several steps share one review — append the feedback to each original brief
+    plan = state.get("plan")
+    descriptions = {st.id: st.description for st in plan.subtasks} if plan else {}
+    feedback = review.retry_instructions or review.feedback
+    return [
+        {
+            **step,
+            "task_brief": (
+                f"{descriptions.get(step['step_id'], step['task_brief'])}\n\n"
+                f"REVIEWER FEEDBACK:\n{feedback}"
+            ),
+        }
+        for step in wave
+    ]
 
-    summary = json.dumps(last_output, indent=2)
-    if len(summary) > 400:
-        summary = summary[:400] + "..."
-    return f"[{last_agent}]: {summary}"
+
+def _dispatch(wave: list[WaveStep]) -> dict:
+    """State update that hands a wave of steps to the conditional edge."""
+    return {
+        "next_agent": wave[0]["agent"],
+        "current_task_brief": "\n".join(step["task_brief"] for step in wave),
+        "wave": wave,
+    }
 
 
 def route_node(state: OrchestratorState) -> dict:
     """
     LangGraph node: Decide the next routing step.
 
-    Reads:  state["task"], state["plan"], state["agent_outputs"],
-            state["iteration_count"], state["last_review"], state["current_step"]
-    Writes: state["next_agent"], state["current_task_brief"], state["iteration_count"]
+    Reads:  state["task"], state["plan"], state["plan_summary"], state["progress_cache"],
+            state["last_output_summary"], state["iteration_count"],
+            state["last_review"], state["completed_steps"], state["wave"]
+    Writes: state["next_agent"], state["current_task_brief"], state["wave"]
     """
     plan = state.get("plan")
     iteration_count = state.get("iteration_count", 0)
-    current_step = state.get("current_step", 0)
+    completed = set(state.get("completed_steps", []))
     last_review = state.get("last_review")
 
     # ── Safety valve: max iterations ──────────
     if iteration_count >= MAX_ITERATIONS:
-        print(f"\t⛔ [ROUTER] Max iterations ({MAX_ITERATIONS}) reached — forcing synthesis.")
+        log.warning(
+            "⛔ [ROUTER] Max iterations (%d) reached — forcing synthesis.", MAX_ITERATIONS,
+            extra={"event": "route.max_iterations"},
+        )
         return {
             "next_agent": "synthesize",
             "current_task_brief": "Synthesize all available outputs into a final response.",
-            "iteration_count": iteration_count,
+            "wave": [],
         }
 
     # ── Check if plan is complete ─────────────
-    if plan and current_step >= len(plan.subtasks):
-        print(f"\t🏁 [ROUTER] All plan steps complete — routing to synthesis.")
+    if plan and all(st.id in completed for st in plan.subtasks):
+        log.info("🏁 [ROUTER] All plan steps complete — routing to synthesis.", extra={"event": "route.complete"})
         return {
             "next_agent": "synthesize",
             "current_task_brief": "All planned steps are complete. Synthesize the results.",
-            "iteration_count": iteration_count,
+            "wave": [],
         }
 
     # ── Handle retry from review ──────────────
-    if last_review and last_review.should_retry:
-        print(f"\t🔄 [ROUTER] Retrying last step with feedback...")
-        # Re-route to the same agent from the current step
-        subtask = plan.subtasks[max(0, current_step - 1)]
-        return {
-            "next_agent": subtask.agent,
-            "current_task_brief": last_review.retry_instructions or subtask.description,
-            "iteration_count": iteration_count,
-        }
-
-    # ── LLM-based routing for complex decisions ──
-    print(f"\n🧭 [ROUTER] Deciding next step (iteration {iteration_count + 1}/{MAX_ITERATIONS})...")
+    if last_review and last_review.should_retry and state.get("wave"):
+        log.info("🔄 [ROUTER] Retrying last step with feedback...", extra={"event": "route.retry"})
+        return _dispatch(_retry_wave(state, last_review))
+
+    # ── Deterministic: the plan already names the next step(s) ──
+    # Only an unresolved needs_retry verdict makes the choice ambiguous.
+    ready = _ready_steps(state)
+    if ready and not (last_review and last_review.quality == "needs_retry"):
+        wave: list[WaveStep] = [
+            {"step_id": st.id, "agent": st.agent, "task_brief": st.description}
+            for st in ready
+        ]
+        if len(wave) > 1:
+            log.info(
+                "🧭 [ROUTER] Dispatching %d independent steps in parallel: [%s]",
+                len(wave), ", ".join(st.agent.upper() for st in ready),
+                extra={"event": "route.wave", "steps": [st.id for st in ready]},
+            )
+        else:
+            log.info(
+                "🧭 [ROUTER] Next plan step %d: [%s]", ready[0].id, ready[0].agent.upper(),
+                extra={"event": "route.step", "steps": [ready[0].id]},
+            )
+        return _dispatch(wave)
+
+    # ── LLM-based routing for ambiguous decisions ──
+    log.info(
+        "🧭 [ROUTER] Deciding next step (iteration %d/%d)...", iteration_count + 1, MAX_ITERATIONS,
+        extra={"event": "route.decide"},
+    )
 
     llm = _get_router_llm()
 
-    plan_summary = _summarize_plan(plan) if plan else "No plan generated."
+    plan_summary = state.get("plan_summary") or "No plan generated."
     progress_summary = _summarize_progress(state)
-    last_output_summary = _get_last_output_summary(state)
+    last_output_summary = state.get("last_output_summary")
     last_review_summary = None
 
     if last_review:
@@ -136,35 +211,57 @@ def route_node(state: OrchestratorState) -> dict:
     )
 
     messages = [
-        SystemMessage(content=ROUTER_SYSTEM),
+        _SYSTEM_MESSAGE,
         HumanMessage(content=user_prompt),
     ]
 
     decision: RouteDecision = llm.invoke(messages)
 
-    print(f"\t→ Next: [{decision.next_agent.upper()}]")
-    print(f"\t→ Brief: {decision.task_brief[:200]}...")
-    print(f"\t→ Reason: {decision.reasoning[:200]}...")
+    log.info(
+        "→ Next: [%s]\n\t→ Brief: %s...", decision.next_agent.upper(), decision.task_brief[:200],
+        extra={"event": "route.decision", "agent": decision.next_agent},
+    )
+    log.debug("→ Reason: %s...", decision.reasoning[:200], extra={"event": "route.reasoning"})
 
-    return {
-        "next_agent": decision.next_agent,
-        "current_task_brief": decision.task_brief,
-        "iteration_count": iteration_count,  # incremented in agent execution
-    }
+    if decision.next_agent == "synthesize":
+        return {
+            "next_agent": "synthesize",
+            "current_task_brief": decision.task_brief,
+            "wave": [],
+        }
 
+    wave = [{
+        "step_id": _pending_step_id(state, decision.next_agent),
+        "agent": decision.next_agent,
+        "task_brief": decision.task_brief,
+    }]
+    return _dispatch(wave)
 
-def route_conditional_edge(state: OrchestratorState) -> str:
+
+def route_conditional_edge(state: OrchestratorState) -> list[Send] | str:
     """
     LangGraph conditional edge function.
-    Maps state["next_agent"] to graph node names.
+    Fans the current wave out to agent nodes — one `Send` per step, all
+    executed in the same superstep — or maps to synthesis / end.
 
-    Returns one of: "researcher", "coder", "writer", "synthesize", "__end__"
+    Returns a list of Sends to "researcher" / "coder" / "writer" nodes,
+    or one of: "synthesize", "__end__"
     """
     next_agent = state.get("next_agent", "synthesize")
 
-    if next_agent in ("researcher", "coder", "writer"):
-        return next_agent
-    elif next_agent == "synthesize":
+    if next_agent == "synthesize":
         return "synthesize"
-    else:
-        return "__end__"
\ No newline at end of file
+
+    wave = state.get("wave", [])
+    if not wave:
+        return "__end__"
+
+    # Each branch gets the full state plus its own brief and step id
+    return [
+        Send(step["agent"], {
+            **state,
+            "current_task_brief": step["task_brief"],
+            "step_id": step["step_id"],
+        })
+        for step in wave
+    ]
@@ -6,21 +6,31 @@ response that directly addresses the user's original task.
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
+from functools import lru_cache
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.config import get_stream_writer
 
 from config.prompts import SYNTHESIZER_SYSTEM, build_synthesizer_prompt
-from config.settings import SUPERVISOR_MODEL, SUPERVISOR_TEMPERATURE
+from config.settings import SUPERVISOR_MODEL
+from llm.factory import get_chat_model
+from observability.log import log
 from state.schemas import OrchestratorState
+from supervisor.formatting import dumps
 
 
+_SYSTEM_MESSAGE = SystemMessage(content=SYNTHESIZER_SYSTEM)
+
+
+@lru_cache(maxsize=1)
 def _get_synthesizer_llm() -> ChatGoogleGenerativeAI:
-    return ChatGoogleGenerativeAI(
-        model=SUPERVISOR_MODEL,
-        temperature=0.3,  # slightly creative for polished prose
-    )
+    return get_chat_model(SUPERVISOR_MODEL, 0.3)  # slightly creative for polished prose
+
+
+_AGENT_ORDER = ("researcher", "coder", "writer")
+_DIVIDER = "=" * 60
 
 
 def _format_all_outputs(state: OrchestratorState) -> str:
@@ -28,65 +38,66 @@ def _format_all_outputs(state: OrchestratorState) -> str:
     Format all agent outputs into a readable block for the synthesizer.
     Groups by agent and presents them in execution order.
     """
-    outputs = state.get("agent_outputs", {})
-    if not outputs:
+    if not state.get("agent_outputs"):
         return "No agent outputs were collected."
+    return "\n".join(_iter_sections(state))
 
-    sections = []
-    agent_order = ["researcher", "coder", "writer"]
 
-    for agent_name in agent_order:
-        if agent_name not in outputs or not outputs[agent_name]:
+def _iter_sections(state: OrchestratorState) -> Iterator[str]:
+    """The lines of `_format_all_outputs`, generated in a single pass."""
+    outputs = state.get("agent_outputs", {})
+
+    for agent_name in _AGENT_ORDER:
+        entries = outputs.get(agent_name)
+        if not entries:
             continue
 
-        sections.append(f"{'='*60}")
-        sections.append(f"AGENT: {agent_name.upper()}")
-        sections.append(f"{'='*60}")
+        yield _DIVIDER
+        yield f"AGENT: {agent_name.upper()}"
+        yield _DIVIDER
 
-        for i, output in enumerate(outputs[agent_name]):
-            if len(outputs[agent_name]) > 1:
-                sections.append(f"\n--- Output #{i+1} ---")
+        for i, entry in enumerate(entries):
+            output = entry["data"]
+            if len(entries) > 1:
+                yield f"\n--- Output #{i+1} ---"
 
             # Format based on agent type for readability
             if agent_name == "researcher":
-                findings = output.get("findings", [])
+                yield f"Confidence: {output.get('confidence', 'N/A')}"
+                yield "Findings:"
+                for f in output.get("findings", []):
+                    yield f"  • {f}"
                 sources = output.get("sources", [])
-                gaps = output.get("gaps", [])
-                confidence = output.get("confidence", "N/A")
-
-                sections.append(f"Confidence: {confidence}")
-                sections.append("Findings:")
-                for f in findings:
-                    sections.append(f"  • {f}")
                 if sources:
-                    sections.append("Sources:")
+                    yield "Sources:"
                     for s in sources:
-                        sections.append(f"  - {s}")
+                        yield f"  - {s}"
+                gaps = output.get("gaps", [])
                 if gaps:
-                    sections.append("Gaps:")
+                    yield "Gaps:"
                     for g in gaps:
-                        sections.append(f"  ⚠ {g}")
+                        yield f"  ⚠ {g}"
 
             elif agent_name == "coder":
-                sections.append(f"Language: {output.get('language', 'N/A')}")
-                sections.append(f"Explanation: {output.get('explanation', 'N/A')}")
-                code = output.get("code", "")
-                sections.append(f"Code:\n```\n{code}\n```")
+                yield f"Language: {output.get('language', 'N/A')}"
+                yield f"Explanation: {output.get('explanation', 'N/A')}"
+                # Separate items (joined by newlines) so the code isn't copied into an f-string
+                yield "Code:\n```"
+                yield output.get("code", "")
+                yield "```"
                 deps = output.get("dependencies", [])
                 if deps:
-                    sections.append(f"Dependencies: {', '.join(deps)}")
+                    yield f"Dependencies: {', '.join(deps)}"
 
             elif agent_name == "writer":
-                sections.append(f"Format: {output.get('format', 'N/A')}")
-                sections.append(f"Summary: {output.get('summary', 'N/A')}")
-                sections.append(f"Content:\n{output.get('content', 'N/A')}")
+                yield f"Format: {output.get('format', 'N/A')}"
+                yield f"Summary: {output.get('summary', 'N/A')}"
+                yield f"Content:\n{output.get('content', 'N/A')}"
 
             else:
-                sections.append(json.dumps(output, indent=2))
-
-        sections.append("")  # blank line between agents
+                yield dumps(output)
 
-    return "\n".join(sections)
+        yield ""  # blank line between agents
 
 
 def synthesize_node(state: OrchestratorState) -> dict:
@@ -96,7 +107,7 @@ def synthesize_node(state: OrchestratorState) -> dict:
     Reads:  state["task"], state["agent_outputs"], state["plan"]
     Writes: state["final_output"], state["messages"]
     """
-    print(f"\n🧬 [SYNTHESIZER] Combining outputs into final response...")
+    log.info("🧬 [SYNTHESIZER] Combining outputs into final response...", extra={"event": "synthesize.start"})
 
     task = state["task"]
     all_outputs = _format_all_outputs(state)
@@ -105,19 +116,37 @@ def synthesize_node(state: OrchestratorState) -> dict:
     user_prompt = build_synthesizer_prompt(task, all_outputs)
 
     messages = [
-        SystemMessage(content=SYNTHESIZER_SYSTEM),
+        _SYSTEM_MESSAGE,
         HumanMessage(content=user_prompt),
     ]
 
-    response = llm.invoke(messages)
-    final_output = response.content
-
-    # Log a preview
-    preview = final_output[:200].replace("\n", " ")
-    print(f"  📄 Preview: {preview}...")
-    print(f"\n{'='*60}")
-    print("✨ BRIAREUS — Task Complete")
-    print(f"{'='*60}\n")
+    # Stream the response: preview as soon as it exists, and forward each
+    # chunk to LangGraph's "custom" stream for callers rendering live output
+    stream_writer = get_stream_writer()
+    chunks: list[str] = []
+    size = 0
+    previewed = False
+    for chunk in llm.stream(messages):
+        # Skip empty deltas and non-text (list-of-blocks) chunks, as `_astream_text` does
+        if not (isinstance(chunk.content, str) and chunk.content):
+            continue
+        chunks.append(chunk.content)
+        size += len(chunk.content)
+        stream_writer({"agent": "synthesizer", "step_id": None, "delta": chunk.content})
+        if not previewed and size >= 200:
+            previewed = True
+            log.info(
+                "📄 Preview: %s...", "".join(chunks)[:200].replace("\n", " "),
+                extra={"event": "synthesize.preview"},
+            )
+
+    final_output = "".join(chunks)
+    if not previewed:
+        log.info("📄 Preview: %s", final_output.replace("\n", " "), extra={"event": "synthesize.preview"})
+    log.info(
+        "✨ BRIAREUS — Task Complete",
+        extra={"event": "synthesize.complete", "chars": len(final_output)},
+    )
 
     return {
         "final_output": final_output,